@@ -16,6 +16,20 @@ from src.reasoning.reasoner import Analysis, reason
 from src.proposal.proposer import Proposal, propose
 
 
+# === 출력 포맷 상수 ===
+
+# 구분선
+_SEPARATOR = "=" * 60
+
+# 헤더 + 정량 분석 섹션 제목 (입력과 무관한 고정 줄)
+_HEADER_LINES = (
+    _SEPARATOR,
+    "의사결정 지원 Agent 분석 결과",
+    _SEPARATOR,
+    "",
+    "## 정량 분석 (Quantified Data)",
+    "",
+)
 
 
 def format_deadline(days: int) -> str:
@@ -53,21 +67,10 @@ def format_output_v2(
     proposal: Proposal
 ) -> str:
     """분석 결과를 사람이 읽기 쉬운 형식으로 포맷합니다. (v2)"""
-    lines: list[str] = []
-
-    # 구분선
-    separator = "=" * 60
-
-    # 헤더
-    lines.append(separator)
-    lines.append("의사결정 지원 Agent 분석 결과")
-    lines.append(separator)
-    lines.append("")
+    # 고정 헤더는 모듈 상수를 그대로 사용
+    lines: list[str] = list(_HEADER_LINES)
 
     # 1. 정량 데이터 (v2 신규)
-    lines.append("## 정량 분석 (Quantified Data)")
-    lines.append("")
-
     # 일정
     if result.deadline_days is not None:
         lines.append(f"  - 일정: {format_deadline(result.deadline_days)}")
@@ -100,8 +103,7 @@ def format_output_v2(
     # 3. 요구사항 (간략화)
     lines.append("## 요구사항 요약")
     lines.append("")
-    for req in result.must_have[:5]:  # 최대 5개
-        lines.append(f"  - {req}")
+    lines.extend(f"  - {req}" for req in result.must_have[:5])  # 최대 5개
     if len(result.must_have) > 5:
         lines.append(f"  ... 외 {len(result.must_have) - 5}개")
     lines.append("")
@@ -111,23 +113,19 @@ def format_output_v2(
     lines.append("")
 
     lines.append("### Pros (장점)")
-    for pro in analysis.pros:
-        lines.append(f"  + {pro}")
+    lines.extend(f"  + {pro}" for pro in analysis.pros)
     lines.append("")
 
     lines.append("### Cons (단점)")
-    for con in analysis.cons:
-        lines.append(f"  - {con}")
+    lines.extend(f"  - {con}" for con in analysis.cons)
     lines.append("")
 
     lines.append("### Assumptions (가정)")
-    for assumption in analysis.assumptions:
-        lines.append(f"  > {assumption}")
+    lines.extend(f"  > {assumption}" for assumption in analysis.assumptions)
     lines.append("")
 
     lines.append("### Constraints (제약)")
-    for constraint in analysis.constraints:
-        lines.append(f"  ! {constraint}")
+    lines.extend(f"  ! {constraint}" for constraint in analysis.constraints)
     lines.append("")
 
     # 5. 제안
@@ -139,14 +137,13 @@ def format_output_v2(
     lines.append("")
 
     lines.append("### 다음 고려사항")
-    for consideration in proposal.next_considerations:
-        lines.append(f"  * {consideration}")
+    lines.extend(f"  * {consideration}" for consideration in proposal.next_considerations)
     lines.append("")
 
     # 6. 인간 결정 안내 (핵심)
-    lines.append(separator)
+    lines.append(_SEPARATOR)
     lines.append(f">> {proposal.human_decision_note}")
-    lines.append(separator)
+    lines.append(_SEPARATOR)
 
     return "\n".join(lines)
 
@@ -158,9 +155,11 @@ def main() -> None:
     print("-" * 40)
 
     # 표준 입력에서 EOF까지 읽기
+    # (모호성 점수/일정 합산/요구사항 섹션이 문서 전체를 보므로 스트리밍하지 않는다)
     user_input = sys.stdin.read()
 
-    if not user_input.strip():
+    # 공백 여부만 확인 (strip()처럼 입력 사본을 만들지 않음)
+    if not user_input or user_input.isspace():
         print("입력이 없습니다. 분석할 내용을 입력해 주세요.")
         return
 
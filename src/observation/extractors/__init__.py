@@ -1,13 +1,24 @@
-"""Extractors 패키지"""
+"""
+Extractors 패키지
+
+추출기 모듈은 정규식을 import 시점에 컴파일하므로,
+패키지 속성에 처음 접근할 때 해당 모듈만 불러온다 (PEP 562).
+"""
+
+import importlib
 
 from src.observation.extractors.base import BaseExtractor
-from src.observation.extractors.deadline_extractor import DeadlineExtractor
-from src.observation.extractors.team_extractor import TeamSizeExtractor
-from src.observation.extractors.requirements_extractor import RequirementsExtractor
-from src.observation.extractors.platform_extractor import PlatformExtractor
-from src.observation.extractors.stack_extractor import StackExtractor
-from src.observation.extractors.forbidden_extractor import ForbiddenExtractor
-from src.observation.extractors.utils import format_evidence
+
+# 속성 이름 → 정의된 모듈 (지연 import 대상)
+_LAZY_ATTRS = {
+    "DeadlineExtractor": "src.observation.extractors.deadline_extractor",
+    "TeamSizeExtractor": "src.observation.extractors.team_extractor",
+    "RequirementsExtractor": "src.observation.extractors.requirements_extractor",
+    "PlatformExtractor": "src.observation.extractors.platform_extractor",
+    "StackExtractor": "src.observation.extractors.stack_extractor",
+    "ForbiddenExtractor": "src.observation.extractors.forbidden_extractor",
+    "format_evidence": "src.observation.extractors.utils",
+}
 
 __all__ = [
     "BaseExtractor",
@@ -19,3 +30,18 @@ __all__ = [
     "ForbiddenExtractor",
     "format_evidence",
 ]
+
+
+def __getattr__(name: str):
+    """처음 접근한 속성의 모듈만 import하고 결과를 패키지에 캐시한다."""
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
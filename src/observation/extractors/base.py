@@ -4,18 +4,12 @@ Base Extractor 인터페이스
 모든 Extractor는 이 인터페이스를 따른다.
 """
 
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Optional
 
-
-@dataclass
-class ExtractResult:
-    """추출 결과"""
-    value: Any                      # 추출된 값 (None이면 추출 실패)
-    confidence: float               # 신뢰도 (0.0 ~ 1.0)
-    evidence: str                   # 추출 근거 (원문에서 매칭된 부분)
-    extractor: str = ""             # 추출기 이름
+# 추출 결과 타입은 schema에 한 번만 정의하고 여기서 재노출한다
+from src.observation.schema import ExtractResult
 
 
 class BaseExtractor(ABC):
@@ -27,14 +21,49 @@ class BaseExtractor(ABC):
 
     name: str = "base"
 
+    # 사전 필터 패턴: 텍스트에 없으면 extract를 건너뛴다 (None이면 항상 실행)
+    # 모든 추출 패턴이 공통으로 요구하는 최소 조건만 담아야 한다.
+    TRIGGER_PATTERN: Optional[re.Pattern] = None
+
+    def may_match(
+        self,
+        normalized_text: str,
+        trigger_hits: Optional[dict[re.Pattern, bool]] = None
+    ) -> bool:
+        """
+        추출 패턴이 매칭될 가능성이 있는지 한 번의 스캔으로 확인한다.
+
+        Args:
+            normalized_text: 정규화된 전체 텍스트
+            trigger_hits: 같은 텍스트에 대한 사전 필터 결과 (패턴 → 매칭 여부).
+                          여러 추출기가 같은 사전 필터를 쓰면 스캔을 한 번만 한다.
+        """
+        trigger = self.TRIGGER_PATTERN
+        if trigger is None:
+            return True
+        if trigger_hits is None:
+            return trigger.search(normalized_text) is not None
+
+        hit = trigger_hits.get(trigger)
+        if hit is None:
+            hit = trigger_hits[trigger] = trigger.search(normalized_text) is not None
+        return hit
+
     @abstractmethod
-    def extract(self, normalized_text: str, sentences: list[str]) -> Optional[ExtractResult]:
+    def extract(
+        self,
+        normalized_text: str,
+        sentences: list[str],
+        text_lower: Optional[str] = None
+    ) -> Optional[ExtractResult]:
         """
         텍스트에서 값을 추출한다.
 
         Args:
             normalized_text: 정규화된 전체 텍스트
             sentences: 분리된 문장 리스트
+            text_lower: normalized_text.lower() (Observer가 한 번만 계산해 전달,
+                        None이면 필요한 추출기가 직접 계산)
 
         Returns:
             ExtractResult 또는 None (추출 실패 시)
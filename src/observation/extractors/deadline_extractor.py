@@ -2,7 +2,7 @@
 Deadline Extractor (문장 단위 스캔 + 합산 방식)
 
 일정/기간 정보를 추출하여 일수(days)로 변환한다.
-각 문장에서 년/월/주/일을 개별 스캔하고 합산한다.
+각 문장에서 년/월/주/일을 한 번에 스캔하고 합산한다.
 
 지원 형식:
 - "1 year and 3 months" → 455일
@@ -19,7 +19,7 @@ from dataclasses import dataclass
 from src.observation.extractors.base import BaseExtractor, ExtractResult
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeComponents:
     """시간 구성 요소"""
     years: int = 0
@@ -28,18 +28,6 @@ class TimeComponents:
     days: int = 0
     evidence: str = ""
 
-    def to_days(self) -> int:
-        """총 일수로 변환"""
-        return (
-            self.years * 365 +
-            self.months * 30 +
-            self.weeks * 7 +
-            self.days
-        )
-
-    def is_empty(self) -> bool:
-        return self.years == 0 and self.months == 0 and self.weeks == 0 and self.days == 0
-
 
 class DeadlineExtractor(BaseExtractor):
     """일정/기간 추출기 (문장 단위 스캔 + 합산)"""
@@ -51,46 +39,46 @@ class DeadlineExtractor(BaseExtractor):
     DAYS_PER_MONTH = 30
     DAYS_PER_YEAR = 365
 
-    # === 단위 패턴 (개별 스캔용) ===
-
-    # 년 단위: "1년", "2 years", "1yr"
-    YEAR_PATTERN = re.compile(
-        r'(\d+)\s*(?:년|year|years|yr|yrs)\b',
-        re.IGNORECASE
-    )
-
-    # 월 단위: "3개월", "6 months", "2달", "3mo"
-    # 한글은 단어 경계가 다르므로 별도 처리
-    MONTH_PATTERN = re.compile(
-        r'(\d+)\s*(?:개월|달|month|months|mo|mos)(?:\b|(?=[^a-zA-Z]))',
-        re.IGNORECASE
-    )
-
-    # 주 단위: "2주", "3 weeks", "2w", "3wk"
-    WEEK_PATTERN = re.compile(
-        r'(\d+)\s*(?:주|week|weeks|wk|wks|w)\b',
+    # 사전 필터: 모든 단위/D+N 패턴은 숫자를 요구한다
+    TRIGGER_PATTERN = re.compile(r'\d')
+
+    # === 단위 패턴 (단일 스캔용) ===
+    # 년/월/주/일을 하나의 패턴으로 합치고, 매칭된 단위는 named group으로 구분한다.
+    # 각 단위 표현은 숫자로 시작하지 않으므로 한 위치에서는 하나의 단위만 매칭된다.
+    TIME_UNIT_PATTERN = re.compile(
+        # 년 단위: "1년", "2 years", "1yr"
+        r'(\d+)\s*(?:(?P<years>년|year|years|yr|yrs)\b'
+        # 월 단위: "3개월", "6 months", "2달", "3mo"
+        # 한글은 단어 경계가 다르므로 별도 처리
+        r'|(?P<months>개월|달|month|months|mo|mos)(?:\b|(?=[^a-zA-Z]))'
+        # 주 단위: "2주", "3 weeks", "2w", "3wk"
+        r'|(?P<weeks>주|week|weeks|wk|wks|w)\b'
+        # 일 단위: "10일", "5 days", "3d"
+        r'|(?P<days>일|day|days|d)(?!\w))',
         re.IGNORECASE
     )
 
-    # 일 단위: "10일", "5 days", "3d"
-    DAY_PATTERN = re.compile(
-        r'(\d+)\s*(?:일|day|days|d)(?!\w)',
-        re.IGNORECASE
-    )
+    # evidence 조합 순서 (문장 내 등장 순서와 무관하게 고정)
+    TIME_UNITS = ("years", "months", "weeks", "days")
 
     # D+N 형식: "D+14", "D-7", "D-day" (단어 경계 필요)
     # 주의: "and 3"의 "d 3"와 혼동 방지를 위해 반드시 + 또는 - 필요
     D_PLUS_PATTERN = re.compile(
-        r'(?:^|[\s\(])([dD][+\-]\s*\d+)',
+        r'(?:^|[\s\(])([dD][+\-]\s*(\d+))',
         re.IGNORECASE
     )
 
-    def extract(self, normalized_text: str, sentences: list[str]) -> Optional[ExtractResult]:
+    def extract(
+        self,
+        normalized_text: str,
+        sentences: list[str],
+        text_lower: Optional[str] = None
+    ) -> Optional[ExtractResult]:
         """
         텍스트에서 일정/기간 정보를 추출한다.
 
         전략:
-        1. 각 문장에서 년/월/주/일을 개별 스캔
+        1. 각 문장에서 년/월/주/일을 단일 패턴으로 스캔
         2. 같은 문장 내 발견된 값들을 합산
         3. 가장 완전한 결과 반환
         """
@@ -104,6 +92,10 @@ class DeadlineExtractor(BaseExtractor):
                 best_result = result
                 best_days = result.value
 
+        # 문장이 하나뿐이고 전체 텍스트와 같으면 재스캔 결과도 같으므로 생략
+        if len(sentences) == 1 and sentences[0] == normalized_text:
+            return best_result
+
         # 전체 텍스트에서도 시도 (문장 분리가 안 된 경우 대비)
         full_result = self._extract_from_sentence(normalized_text)
         if full_result and full_result.value > best_days:
@@ -122,10 +114,17 @@ class DeadlineExtractor(BaseExtractor):
         # 년/월/주/일 개별 스캔 및 합산
         components = self._scan_time_components(text)
 
-        if components.is_empty():
+        # 구성 요소가 하나도 없으면 추출 실패
+        if not (components.years or components.months or components.weeks or components.days):
             return None
 
-        total_days = components.to_days()
+        # 총 일수로 변환
+        total_days = (
+            components.years * self.DAYS_PER_YEAR +
+            components.months * self.DAYS_PER_MONTH +
+            components.weeks * self.DAYS_PER_WEEK +
+            components.days
+        )
 
         # 신뢰도 계산
         confidence = self._calculate_confidence(components)
@@ -142,29 +141,16 @@ class DeadlineExtractor(BaseExtractor):
         components = TimeComponents()
         evidence_parts: list[str] = []
 
-        # 년 스캔
-        year_match = self.YEAR_PATTERN.search(text)
-        if year_match:
-            components.years = int(year_match.group(1))
-            evidence_parts.append(year_match.group())
-
-        # 월 스캔
-        month_match = self.MONTH_PATTERN.search(text)
-        if month_match:
-            components.months = int(month_match.group(1))
-            evidence_parts.append(month_match.group())
-
-        # 주 스캔
-        week_match = self.WEEK_PATTERN.search(text)
-        if week_match:
-            components.weeks = int(week_match.group(1))
-            evidence_parts.append(week_match.group())
-
-        # 일 스캔
-        day_match = self.DAY_PATTERN.search(text)
-        if day_match:
-            components.days = int(day_match.group(1))
-            evidence_parts.append(day_match.group())
+        # 한 번의 스캔으로 단위별 첫 매칭만 보관
+        first_matches: dict[str, re.Match] = {}
+        for match in self.TIME_UNIT_PATTERN.finditer(text):
+            first_matches.setdefault(match.lastgroup, match)
+
+        for unit in self.TIME_UNITS:
+            match = first_matches.get(unit)
+            if match:
+                setattr(components, unit, int(match.group(1)))
+                evidence_parts.append(match.group())
 
         # evidence 조합
         if evidence_parts:
@@ -176,39 +162,28 @@ class DeadlineExtractor(BaseExtractor):
         """D+N 형식 추출"""
         match = self.D_PLUS_PATTERN.search(text)
         if match:
-            # 그룹 1에서 D+숫자 부분 추출
-            d_part = match.group(1)
-            # 숫자만 추출
-            num_match = re.search(r'\d+', d_part)
-            if num_match:
-                days = int(num_match.group())
-                return ExtractResult(
-                    value=days,
-                    confidence=0.9,
-                    evidence=d_part.strip(),
-                    extractor=self.name
-                )
+            # 그룹 1: D+숫자 부분 (evidence), 그룹 2: 숫자
+            return ExtractResult(
+                value=int(match.group(2)),
+                confidence=0.9,
+                evidence=match.group(1),
+                extractor=self.name
+            )
         return None
 
     def _calculate_confidence(self, components: TimeComponents) -> float:
         """구성 요소에 따른 신뢰도 계산"""
-        # 복합 형식(년+월)이면 높은 신뢰도
-        component_count = sum([
-            1 if components.years > 0 else 0,
-            1 if components.months > 0 else 0,
-            1 if components.weeks > 0 else 0,
-            1 if components.days > 0 else 0,
-        ])
+        # 0보다 큰 구성 요소 개수 (bool 합산, 리스트 생성 없음)
+        component_count = (
+            (components.years > 0) +
+            (components.months > 0) +
+            (components.weeks > 0) +
+            (components.days > 0)
+        )
 
         if component_count >= 2:
-            return 0.95  # 복합 형식
-        elif components.years > 0:
-            return 0.85
-        elif components.months > 0:
-            return 0.85
-        elif components.weeks > 0:
-            return 0.85
-        elif components.days > 0:
-            return 0.8
-        else:
-            return 0.7
+            return 0.95  # 복합 형식(년+월 등)
+        if component_count == 1:
+            # 일 단위 단독은 주/월/년보다 약간 낮은 신뢰도
+            return 0.8 if components.days > 0 else 0.85
+        return 0.7
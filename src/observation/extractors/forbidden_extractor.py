@@ -24,70 +24,84 @@ class ForbiddenExtractor(BaseExtractor):
 
     name = "forbidden"
 
+    # 사전 필터: 모든 금지 패턴의 고정 키워드를 하나로 합친 alternation
+    TRIGGER_PATTERN = re.compile(
+        r'forbidden|금지|allowed|불가|without|prohibited|use',
+        re.IGNORECASE
+    )
+
     # 금지 키워드 패턴 (기술 키워드 우선 캡처)
+    # (고정 키워드, 패턴) - 고정 키워드가 소문자 텍스트에 없으면 해당 패턴은 스캔하지 않는다.
+    # 뒤에 공백이 반드시 오는 \w+ 는 possessive(\w++)로 두어 역추적을 막는다.
+    # ("X 금지" 패턴은 \w+ 가 "금지"까지 먹은 뒤 되돌아와야 하므로 제외)
     FORBIDDEN_PATTERNS = [
         # 괄호 안의 금지 표현: "(LLM is forbidden)" - 우선순위 높음
-        re.compile(
-            r'\((\w+)\s+(?:is\s+)?forbidden\)',
-            re.IGNORECASE
+        (
+            "forbidden",
+            re.compile(r'\((\w++)\s+(?:is\s+)?forbidden\)', re.IGNORECASE),
         ),
         # "X usage is forbidden" - X를 캡처 (usage는 무시)
-        re.compile(
-            r'(\w+)\s+usage\s+is\s+forbidden',
-            re.IGNORECASE
+        (
+            "forbidden",
+            re.compile(r'(\w++)\s+usage\s+is\s+forbidden', re.IGNORECASE),
         ),
         # "X is forbidden" (단일 단어, usage/access 등 일반명사 제외)
-        re.compile(
-            r'(\w+)\s+is\s+forbidden',
-            re.IGNORECASE
+        (
+            "forbidden",
+            re.compile(r'(\w++)\s+is\s+forbidden', re.IGNORECASE),
         ),
         # "X forbidden" (is 없이)
-        re.compile(
-            r'(\w+)\s+forbidden',
-            re.IGNORECASE
+        (
+            "forbidden",
+            re.compile(r'(\w++)\s+forbidden', re.IGNORECASE),
         ),
         # "X 사용 금지", "X 금지"
-        re.compile(
-            r'(\w+)\s*(?:사용\s*)?금지',
-            re.IGNORECASE
+        (
+            "금지",
+            re.compile(r'(\w+)\s*(?:사용\s*)?금지', re.IGNORECASE),
         ),
         # "X usage is not allowed"
-        re.compile(
-            r'(\w+)\s+usage\s+is\s+not\s+allowed',
-            re.IGNORECASE
+        (
+            "allowed",
+            re.compile(r'(\w++)\s+usage\s+is\s+not\s+allowed', re.IGNORECASE),
         ),
         # "X is not allowed"
-        re.compile(
-            r'(\w+)\s+is\s+not\s+allowed',
-            re.IGNORECASE
+        (
+            "allowed",
+            re.compile(r'(\w++)\s+is\s+not\s+allowed', re.IGNORECASE),
         ),
         # "X not allowed"
-        re.compile(
-            r'(\w+)\s+not\s+allowed',
-            re.IGNORECASE
+        (
+            "allowed",
+            re.compile(r'(\w++)\s+not\s+allowed', re.IGNORECASE),
         ),
         # "X 불가", "X 사용 불가"
-        re.compile(
-            r'(\w+)\s+(?:사용\s*)?불가',
-            re.IGNORECASE
+        (
+            "불가",
+            re.compile(r'(\w++)\s+(?:사용\s*)?불가', re.IGNORECASE),
         ),
         # "without X"
-        re.compile(
-            r'without\s+(\w+)',
-            re.IGNORECASE
+        (
+            "without",
+            re.compile(r'without\s+(\w++)', re.IGNORECASE),
         ),
         # "X prohibited"
-        re.compile(
-            r'(\w+)\s+prohibited',
-            re.IGNORECASE
+        (
+            "prohibited",
+            re.compile(r'(\w++)\s+prohibited', re.IGNORECASE),
         ),
         # "don't use X"
-        re.compile(
-            r"(?:don't|do\s+not)\s+use\s+(\w+)",
-            re.IGNORECASE
+        (
+            "use",
+            re.compile(r"(?:don't|do\s+not)\s+use\s+(\w++)", re.IGNORECASE),
         ),
     ]
 
+    # (고정 키워드, 바인딩된 finditer) - 루프 내 속성 조회 생략
+    FORBIDDEN_SCANNERS = tuple(
+        (anchor, pattern.finditer) for anchor, pattern in FORBIDDEN_PATTERNS
+    )
+
     # 일반적인 금지 대상 (정규화용)
     FORBIDDEN_NORMALIZE = {
         "llm": "LLM",
@@ -101,19 +115,32 @@ class ForbiddenExtractor(BaseExtractor):
         "클라우드": "Cloud",
     }
 
-    def extract(self, normalized_text: str, sentences: list[str]) -> Optional[ExtractResult]:
+    def extract(
+        self,
+        normalized_text: str,
+        sentences: list[str],
+        text_lower: Optional[str] = None
+    ) -> Optional[ExtractResult]:
         """텍스트에서 금지 사항을 추출한다."""
 
         forbidden_items: list[str] = []
         evidence_parts: list[str] = []
+        seen: set[str] = set()  # 중복 확인용 (순서는 forbidden_items가 유지)
 
-        # 모든 금지 패턴 스캔
-        for pattern in self.FORBIDDEN_PATTERNS:
-            for match in pattern.finditer(normalized_text):
+        if text_lower is None:
+            text_lower = normalized_text.lower()
+
+        # 모든 금지 패턴 스캔 (패턴 순서 = 출력 우선순위)
+        for anchor, finditer in self.FORBIDDEN_SCANNERS:
+            # 고정 키워드가 없으면 매칭될 수 없으므로 스캔 생략
+            if anchor not in text_lower:
+                continue
+            for match in finditer(normalized_text):
                 item = match.group(1).strip()
                 normalized_item = self._normalize_item(item)
 
-                if normalized_item and normalized_item not in forbidden_items:
+                if normalized_item and normalized_item not in seen:
+                    seen.add(normalized_item)
                     forbidden_items.append(normalized_item)
                     evidence_parts.append(match.group(0).strip())
 
@@ -121,14 +148,14 @@ class ForbiddenExtractor(BaseExtractor):
             return None
 
         return ExtractResult(
-            value=forbidden_items,
+            value=tuple(forbidden_items),
             confidence=0.9,
             evidence=format_evidence(" | ".join(evidence_parts)),
             extractor=self.name
         )
 
     # 무시할 단어 (금지 대상이 아닌 일반 단어)
-    IGNORE_WORDS = {
+    IGNORE_WORDS = frozenset({
         # 조동사/be동사
         "is", "are", "was", "were", "be", "been", "being",
         # 관사
@@ -136,7 +163,7 @@ class ForbiddenExtractor(BaseExtractor):
         # 일반 명사 (기술 키워드가 아닌 것)
         "usage", "access", "use", "it", "this", "that",
         "internet", "network",  # 너무 일반적인 단어
-    }
+    })
 
     def _normalize_item(self, item: str) -> str:
         """금지 항목 정규화"""
@@ -15,6 +15,7 @@ import re
 from typing import Optional
 
 from src.observation.extractors.base import BaseExtractor, ExtractResult
+from src.observation.extractors.utils import find_keyword_evidence
 
 
 class PlatformExtractor(BaseExtractor):
@@ -49,6 +50,13 @@ class PlatformExtractor(BaseExtractor):
         "멀티플랫폼": "Cross-platform",
     }
 
+    # 직접 매칭용 (키워드, 플랫폼, evidence 패턴) - 클래스 로드 시 한 번만 컴파일
+    # PLATFORM_MAP 순서를 그대로 유지한다 (먼저 정의된 키워드 우선)
+    KEYWORD_PATTERNS = tuple(
+        (keyword, platform, re.compile(re.escape(keyword), re.IGNORECASE))
+        for keyword, platform in PLATFORM_MAP.items()
+    )
+
     # 플랫폼 컨텍스트 패턴
     CONTEXT_PATTERNS = [
         # "Platform은 Windows 기반이고"
@@ -73,14 +81,33 @@ class PlatformExtractor(BaseExtractor):
         ),
     ]
 
-    def extract(self, normalized_text: str, sentences: list[str]) -> Optional[ExtractResult]:
+    # 컨텍스트 패턴의 search 메서드를 미리 바인딩 (루프 내 속성 조회 생략)
+    CONTEXT_SEARCHES = tuple(pattern.search for pattern in CONTEXT_PATTERNS)
+
+    def extract(
+        self,
+        normalized_text: str,
+        sentences: list[str],
+        text_lower: Optional[str] = None
+    ) -> Optional[ExtractResult]:
         """텍스트에서 플랫폼 정보를 추출한다."""
 
-        text_lower = normalized_text.lower()
+        if text_lower is None:
+            text_lower = normalized_text.lower()
+
+        # 0. 사전 필터: PLATFORM_MAP 키워드가 하나도 없으면 추출 불가
+        #    (컨텍스트 패턴도 후보가 PLATFORM_MAP 키일 때만 채택하므로)
+        #    찾은 첫 키워드는 2단계 직접 매칭 결과로 그대로 재사용한다.
+        direct_match = next(
+            (entry for entry in self.KEYWORD_PATTERNS if entry[0] in text_lower),
+            None
+        )
+        if direct_match is None:
+            return None
 
         # 1. 컨텍스트 패턴으로 먼저 시도
-        for pattern in self.CONTEXT_PATTERNS:
-            match = pattern.search(normalized_text)
+        for search in self.CONTEXT_SEARCHES:
+            match = search(normalized_text)
             if match:
                 candidate = match.group(1).lower()
                 if candidate in self.PLATFORM_MAP:
@@ -91,19 +118,14 @@ class PlatformExtractor(BaseExtractor):
                         extractor=self.name
                     )
 
-        # 2. 직접 키워드 매칭
-        for keyword, platform in self.PLATFORM_MAP.items():
-            if keyword in text_lower:
-                # evidence 찾기
-                pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-                match = pattern.search(normalized_text)
-                evidence = match.group(0) if match else keyword
-
-                return ExtractResult(
-                    value=platform,
-                    confidence=0.85,
-                    evidence=evidence,
-                    extractor=self.name
-                )
-
-        return None
+        # 2. 직접 키워드 매칭 (PLATFORM_MAP 순서상 첫 키워드)
+        keyword, platform, pattern = direct_match
+        # evidence 찾기 (소문자 텍스트의 위치로 원문을 잘라 씀)
+        evidence = find_keyword_evidence(keyword, normalized_text, text_lower, pattern) or keyword
+
+        return ExtractResult(
+            value=platform,
+            confidence=0.85,
+            evidence=evidence,
+            extractor=self.name
+        )
@@ -20,20 +20,72 @@ Requirements Extractor
 """
 
 import re
-from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
 
 from src.observation.extractors.base import BaseExtractor, ExtractResult
-from src.observation.extractors.utils import format_evidence, truncate_at_word_boundary
-
-
-@dataclass
-class RequirementsResult:
-    """요구사항 추출 결과"""
-    must_have: list[str]
-    nice_to_have: list[str]
-    must_have_evidence: str = ""
-    nice_to_have_evidence: str = ""
+from src.observation.extractors.utils import (
+    format_evidence,
+    lower_preserves_offsets,
+    truncate_at_word_boundary,
+)
+# 추출 결과 타입은 schema에 정의하고 여기서 재노출한다 (observer가 추출기 모듈 없이 참조)
+from src.observation.schema import RequirementsResult
+
+
+# === 항목 정리용 패턴 (모듈 로드 시 한 번만 컴파일) ===
+
+# 항목 앞에 붙은 ": - " 또는 "- "
+_STRIP_PREFIX = re.compile(r'^[:\-\s]+')
+
+# 항목 끝의 괄호 내용 (예: "(Korean/English)")
+_PAREN_TAIL = re.compile(r'\s*\([^)]*\)\s*$')
+
+# evidence의 불릿/하이픈 주변 공백
+_BULLET = re.compile(r'\s*-\s*')
+
+# 한글 음절 - 한글 키워드로 시작하는 섹션 구분 및 입력 텍스트의 한글 포함 여부 확인용
+_HANGUL = re.compile(r'[\uac00-\ud7a3]')
+
+# 콤마 외의 항목 구분자 고정 문자열 ("and"는 소문자 텍스트에서 확인)
+# 하나도 없으면 ITEM_SPLIT_PATTERN 분리 결과가 str.split(',') 후 strip 한 것과 같다
+_NON_COMMA_SEPARATORS = ('-', '、', '，', '및', '이고', '하고')
+
+
+def _build_sections(
+    starters: list[re.Pattern],
+    exclude_starters: list[re.Pattern],
+    terminators: list[re.Pattern],
+    flags: int = re.IGNORECASE
+) -> tuple[tuple[re.Pattern, re.Pattern, bool], ...]:
+    """
+    시작 패턴마다 (시작 패턴, 섹션 종료 패턴, 한글 필요 여부)를 만든다.
+
+    종료 패턴은 섹션 종료 키워드 + 반대 타입 시작 패턴 + 같은 타입의 다른 시작 패턴을
+    하나의 alternation으로 합친 것이다. alternation 검색은 가장 앞선 위치의 매칭을
+    반환하므로, 개별 패턴을 각각 검색해 최소 위치를 고르는 것과 결과가 같다.
+
+    flags=0 이면 소문자 텍스트 검색용으로 시작 패턴도 IGNORECASE 없이 다시 컴파일한다.
+    (패턴 문자열은 모두 소문자로 작성되어 있어야 한다)
+
+    한글이 들어간 시작 패턴은 한글 음절이 있어야만 매칭되므로, 한글이 없는 텍스트에서는
+    그 섹션 검색을 건너뛸 수 있도록 표시해 둔다.
+    """
+    sections = []
+    for starter in starters:
+        alternatives = [p.pattern for p in terminators]
+        alternatives += [p.pattern for p in exclude_starters]
+        alternatives += [p.pattern for p in starters if p is not starter]
+        end_pattern = re.compile(
+            "|".join(f"(?:{alternative})" for alternative in alternatives),
+            flags
+        )
+        sections.append((
+            re.compile(starter.pattern, flags),
+            end_pattern,
+            _HANGUL.search(starter.pattern) is not None,
+        ))
+    return tuple(sections)
 
 
 class RequirementsExtractor(BaseExtractor):
@@ -41,30 +93,41 @@ class RequirementsExtractor(BaseExtractor):
 
     name = "requirements"
 
+    # 사전 필터: 모든 섹션 시작 패턴은 아래 고정 키워드 중 하나로 시작한다
+    TRIGGER_PATTERN = re.compile(
+        r'must|core|필수|핵심|nice|optional|있으면|선택',
+        re.IGNORECASE
+    )
+
     # 섹션 종료 키워드 (이후 내용은 캡처하지 않음)
     # 주의: 정규화 후 개행이 공백으로 바뀌므로 \s 패턴 사용
+    # 주의: 섹션 관련 패턴 문자열은 소문자로 작성한다 (소문자 텍스트 검색용으로 재사용)
     SECTION_TERMINATORS = [
-        r'(?:\n|\s)Constraints?:',
-        r'(?:\n|\s)Nice\s+to\s+have:',
-        r'(?:\n|\s)Must\s+have:',
-        r'(?:\n|\s)제약',
-        r'(?:\n|\s)선택',
-        r'(?:\n|\s)필수',
-        r'(?:\n|\s)Ask:',
-        r'(?:\n|\s)Timeline',
-        r'(?:\n|\s)Team',
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r'(?:\n|\s)constraints?:',
+            r'(?:\n|\s)nice\s+to\s+have:',
+            r'(?:\n|\s)must\s+have:',
+            r'(?:\n|\s)제약',
+            r'(?:\n|\s)선택',
+            r'(?:\n|\s)필수',
+            r'(?:\n|\s)ask:',
+            r'(?:\n|\s)timeline',
+            r'(?:\n|\s)team',
+        )
     ]
 
     # === Must Have 시작 패턴 ===
     MUST_HAVE_STARTERS = [
         # "Must have: X, Y, Z." 형식 (콜론 형식)
-        re.compile(r'[Mm]ust[\s\-]?have\s*:', re.IGNORECASE),
+        re.compile(r'must[\s\-]?have\s*:', re.IGNORECASE),
         # "Must have features are X and Y" 형식 (영어)
-        re.compile(r'[Mm]ust[\s\-]?have\s+(?:features?|requirements?)\s+(?:is|are)', re.IGNORECASE),
+        re.compile(r'must[\s\-]?have\s+(?:features?|requirements?)\s+(?:is|are)', re.IGNORECASE),
         # "Must have 기능은" 형식 (한영 혼합)
-        re.compile(r'[Mm]ust[\s\-]?have[^\n:]*?(?:는|은|기능은)', re.IGNORECASE),
+        # 첫 '는'/'은'까지 (lazy [^\n:]*?(?:는|은|기능은) 와 같은 매칭, 역추적 없음)
+        re.compile(r'must[\s\-]?have[^\n:는은]*+[는은]', re.IGNORECASE),
         # "Core requirement is" 형식
-        re.compile(r'[Cc]ore\s+requirement[s]?\s+(?:is|are)', re.IGNORECASE),
+        re.compile(r'core\s+requirement[s]?\s+(?:is|are)', re.IGNORECASE),
         # "필수 기능:" 또는 "필수:" 형식
         re.compile(r'필수(?:\s*기능)?[은는]?\s*[:：]?', re.IGNORECASE),
         # "핵심 기능은" 형식
@@ -74,19 +137,32 @@ class RequirementsExtractor(BaseExtractor):
     # === Nice to Have 시작 패턴 ===
     NICE_TO_HAVE_STARTERS = [
         # "Nice to have: X, Y." 형식 (콜론 형식)
-        re.compile(r'[Nn]ice[\s\-]?to[\s\-]?have\s*:', re.IGNORECASE),
+        re.compile(r'nice[\s\-]?to[\s\-]?have\s*:', re.IGNORECASE),
         # "Nice to have 로는" 형식 (한영 혼합)
-        re.compile(r'[Nn]ice[\s\-]?to[\s\-]?have[^\n:]*?(?:로는|로|는|은)', re.IGNORECASE),
+        # 첫 '로(는)'/'는'/'은'까지 (lazy [^\n:]*?(?:로는|로|는|은) 와 같은 매칭, 역추적 없음)
+        re.compile(r'nice[\s\-]?to[\s\-]?have[^\n:로는은]*+(?:로는?|는|은)', re.IGNORECASE),
         # "Nice features include" 형식
-        re.compile(r'[Nn]ice\s+features?\s+include[s]?', re.IGNORECASE),
+        re.compile(r'nice\s+features?\s+include[s]?', re.IGNORECASE),
         # "Optional:" 형식
-        re.compile(r'[Oo]ptional\s*[:：]', re.IGNORECASE),
+        re.compile(r'optional\s*[:：]', re.IGNORECASE),
         # "있으면 좋은 기능" 형식 (반드시 "기능" 또는 콜론 필요)
         re.compile(r'있으면\s*좋[은겠]?\s*기능[은는]?\s*[:：]?', re.IGNORECASE),
         # "선택 기능:" 형식
         re.compile(r'선택(?:\s*기능)?[은는]?\s*[:：]?', re.IGNORECASE),
     ]
 
+    # === 섹션 (시작 패턴, 종료 패턴) 쌍 ===
+    # 소문자 텍스트 검색용 (IGNORECASE 없음 - 리터럴 접두어 최적화가 적용된다)
+    # 모든 시작 패턴은 고정 문자열(must, nice, core, optional, 필수, 핵심, 있으면, 선택)로
+    # 시작하므로, re가 그 접두어를 str.find처럼 먼저 찾고 나머지 패턴은 후보 위치에서만 확인한다.
+    # (별도의 접두어 find + pos 재검색은 같은 일을 두 번 하게 된다)
+    MUST_HAVE_SECTIONS_LOWER = _build_sections(
+        MUST_HAVE_STARTERS, NICE_TO_HAVE_STARTERS, SECTION_TERMINATORS, flags=0
+    )
+    NICE_TO_HAVE_SECTIONS_LOWER = _build_sections(
+        NICE_TO_HAVE_STARTERS, MUST_HAVE_STARTERS, SECTION_TERMINATORS, flags=0
+    )
+
     # === 항목 분리 패턴 ===
     # bullet point (\n- 또는 정규화된 " - "), 콤마, and, 및 등으로 분리
     # 주의: " - " 패턴은 단어 경계에서만 분리 (SECS-GEM 같은 하이픈 용어 보존)
@@ -102,39 +178,59 @@ class RequirementsExtractor(BaseExtractor):
         re.IGNORECASE
     )
 
-    def extract(self, normalized_text: str, sentences: list[str]) -> Optional[ExtractResult]:
+    def extract(
+        self,
+        normalized_text: str,
+        sentences: list[str],
+        text_lower: Optional[str] = None
+    ) -> Optional[ExtractResult]:
         """
         텍스트에서 must_have와 nice_to_have 항목을 추출한다.
         """
-        result = RequirementsResult(
-            must_have=[],
-            nice_to_have=[]
-        )
+        if text_lower is None:
+            text_lower = normalized_text.lower()
+
+        # 소문자 텍스트의 위치가 원문과 같으면 소문자 패턴으로 text_lower를 검색하고,
+        # 아니면 IGNORECASE 패턴으로 원문을 검색한다
+        if lower_preserves_offsets(normalized_text, text_lower):
+            scan_text = text_lower
+            must_have_sections = self.MUST_HAVE_SECTIONS_LOWER
+            nice_to_have_sections = self.NICE_TO_HAVE_SECTIONS_LOWER
+        else:
+            scan_text = normalized_text
+            must_have_sections, nice_to_have_sections = _ignorecase_sections()
+
+        # 한글이 없으면 한글 키워드 섹션(필수/핵심/있으면/선택 등)은 검색하지 않는다
+        has_hangul = not scan_text.isascii() and _HANGUL.search(scan_text) is not None
 
         # Must Have 추출
         must_have_items, must_have_evidence = self._extract_section(
             normalized_text,
-            self.MUST_HAVE_STARTERS,
-            exclude_starters=self.NICE_TO_HAVE_STARTERS
+            scan_text,
+            must_have_sections,
+            has_hangul
         )
-        if must_have_items:
-            result.must_have = must_have_items
-            result.must_have_evidence = must_have_evidence
 
         # Nice to Have 추출
         nice_to_have_items, nice_to_have_evidence = self._extract_section(
             normalized_text,
-            self.NICE_TO_HAVE_STARTERS,
-            exclude_starters=self.MUST_HAVE_STARTERS
+            scan_text,
+            nice_to_have_sections,
+            has_hangul
         )
-        if nice_to_have_items:
-            result.nice_to_have = nice_to_have_items
-            result.nice_to_have_evidence = nice_to_have_evidence
 
         # 아무것도 추출되지 않았으면 None 반환
-        if not result.must_have and not result.nice_to_have:
+        if not must_have_items and not nice_to_have_items:
             return None
 
+        # 항목이 없는 섹션은 evidence도 비어 있다 (_extract_section 반환값)
+        result = RequirementsResult(
+            must_have=tuple(must_have_items),
+            nice_to_have=tuple(nice_to_have_items),
+            must_have_evidence=must_have_evidence,
+            nice_to_have_evidence=nice_to_have_evidence
+        )
+
         # evidence 조합
         evidence_parts = []
         if result.must_have_evidence:
@@ -152,70 +248,62 @@ class RequirementsExtractor(BaseExtractor):
     def _extract_section(
         self,
         text: str,
-        starters: list[re.Pattern],
-        exclude_starters: list[re.Pattern]
+        scan_text: str,
+        sections: tuple[tuple[re.Pattern, re.Pattern, bool], ...],
+        has_hangul: bool = True
     ) -> tuple[list[str], str]:
         """
         섹션 시작 패턴을 찾고, 섹션 종료 조건까지의 내용을 추출한다.
         여러 섹션이 있으면 모두 수집한다 (예: "Must have:" + "필수 기능:")
 
+        패턴 검색은 scan_text(원문 또는 같은 위치의 소문자 텍스트)에서 하고,
+        항목/evidence는 원문(text)을 잘라 만든다.
+        has_hangul이 False면 한글이 필요한 시작 패턴은 검색하지 않는다.
+
+        섹션 종료 위치 (가장 먼저 나오는 것):
+        1. 섹션 종료 키워드
+        2. 다른 섹션 시작 키워드
+        3. 같은 타입의 다른 섹션 시작 (중복 방지)
+
         Returns:
             (items_list, evidence_string)
         """
         all_items: list[str] = []
+        seen: set[str] = set()  # 중복 확인용 (순서는 all_items가 유지)
         all_evidence: list[str] = []
 
-        for starter in starters:
+        for starter, end_pattern, needs_hangul in sections:
+            if needs_hangul and not has_hangul:
+                continue
             # 모든 매칭을 찾음 (finditer)
-            for match in starter.finditer(text):
+            for match in starter.finditer(scan_text):
                 start_pos = match.end()
-                section_start = match.group(0)
-
-                # 섹션 종료 위치 찾기
-                end_pos = len(text)
-
-                # 1. 섹션 종료 키워드 확인
-                for terminator in self.SECTION_TERMINATORS:
-                    term_match = re.search(terminator, text[start_pos:], re.IGNORECASE)
-                    if term_match:
-                        candidate_end = start_pos + term_match.start()
-                        if candidate_end < end_pos:
-                            end_pos = candidate_end
-
-                # 2. 다른 섹션 시작 키워드 확인
-                for exclude_starter in exclude_starters:
-                    exclude_match = exclude_starter.search(text[start_pos:])
-                    if exclude_match:
-                        candidate_end = start_pos + exclude_match.start()
-                        if candidate_end < end_pos:
-                            end_pos = candidate_end
-
-                # 3. 같은 타입의 다른 섹션 시작 확인 (중복 방지)
-                for other_starter in starters:
-                    if other_starter != starter:
-                        other_match = other_starter.search(text[start_pos:])
-                        if other_match:
-                            candidate_end = start_pos + other_match.start()
-                            if candidate_end < end_pos:
-                                end_pos = candidate_end
+                section_start = text[match.start():start_pos]
 
-                section_text = text[start_pos:end_pos]
+                # 섹션 종료 위치 찾기 (종료 조건 전체를 한 번에 검색)
+                end_match = end_pattern.search(scan_text, start_pos)
+                end_pos = end_match.start() if end_match else len(text)
 
                 # 라인 내 종료 패턴 확인 (마침표, "가 있으면" 등)
-                end_match = self.ITEM_END_PATTERN.search(section_text)
+                # 섹션 범위(pos~endpos)만 검색하므로 중간 슬라이스가 필요 없다
+                end_match = self.ITEM_END_PATTERN.search(text, start_pos, end_pos)
                 if end_match:
-                    section_text = section_text[:end_match.start()]
+                    end_pos = end_match.start()
+
+                section_text = text[start_pos:end_pos]
 
                 # 항목 추출
-                items = self._split_items(section_text)
-                if items:
+                has_items = False
+                for item in self._iter_items(section_text):
+                    has_items = True
                     # 중복 제거하며 추가
-                    for item in items:
-                        if item not in all_items:
-                            all_items.append(item)
+                    if item not in seen:
+                        seen.add(item)
+                        all_items.append(item)
+                if has_items:
                     # evidence: 줄바꿈/불릿을 공백으로 정리, 단어 경계에서 자르기
                     evidence_text = section_start + section_text.strip()
-                    evidence_text = re.sub(r'\s*-\s*', ' ', evidence_text)  # 불릿 정리
+                    evidence_text = _BULLET.sub(' ', evidence_text)  # 불릿 정리
                     evidence_text = format_evidence(evidence_text)
                     all_evidence.append(truncate_at_word_boundary(evidence_text, 100))
 
@@ -224,18 +312,24 @@ class RequirementsExtractor(BaseExtractor):
 
         return [], ""
 
-    def _split_items(self, text: str) -> list[str]:
+    def _iter_items(self, text: str) -> Iterator[str]:
         """
-        텍스트를 개별 항목으로 분리한다.
+        텍스트를 개별 항목으로 분리한다. (리스트를 만들지 않고 하나씩 반환)
         """
         if not text:
-            return []
-
-        # 분리
-        items = self.ITEM_SPLIT_PATTERN.split(text)
-
-        # 정리
-        cleaned = []
+            return
+
+        # 분리 (콤마만 구분자로 쓰인 경우가 대부분이므로 str.split으로 처리)
+        if (
+            any(separator in text for separator in _NON_COMMA_SEPARATORS)
+            or 'and' in text.lower()
+        ):
+            items = self.ITEM_SPLIT_PATTERN.split(text)
+        else:
+            items = text.split(',')
+
+        # 정리 (한 번의 루프로 처리, 메서드 조회는 루프 밖에서 한 번만)
+        clean_item = self._clean_item
         for item in items:
             item = item.strip()
 
@@ -244,7 +338,9 @@ class RequirementsExtractor(BaseExtractor):
                 continue
 
             # 앞에 붙은 ": - " 또는 "- " 제거
-            item = re.sub(r'^[:\-\s]+', '', item).strip()
+            # (strip 후이므로 첫 글자가 ':' 또는 '-'일 때만 해당)
+            if item[0] in ':-':
+                item = _STRIP_PREFIX.sub('', item).strip()
 
             # 빈 항목 스킵 (정리 후)
             if not item:
@@ -252,18 +348,15 @@ class RequirementsExtractor(BaseExtractor):
 
             # " + " 분리 (단, "C++" 등 언어명은 제외)
             # "A (...) + B" -> ["A (...)", "B"]
-            if ' + ' in item and 'C++' not in item and '++' not in item:
-                sub_items = [s.strip() for s in item.split(' + ') if s.strip()]
-                for sub in sub_items:
-                    sub = self._clean_item(sub)
-                    if sub:
-                        cleaned.append(sub)
+            if ' + ' in item and '++' not in item:
+                parts = [s.strip() for s in item.split(' + ')]
             else:
-                item = self._clean_item(item)
-                if item:
-                    cleaned.append(item)
+                parts = (item,)
 
-        return cleaned
+            for part in parts:
+                part = clean_item(part)
+                if part:
+                    yield part
 
     def _clean_item(self, item: str) -> str:
         """개별 항목 정리"""
@@ -275,9 +368,38 @@ class RequirementsExtractor(BaseExtractor):
             return ""
 
         # 괄호 내용 제거 (예: "(Korean/English)" 제거)
-        item = re.sub(r'\s*\([^)]*\)\s*$', '', item).strip()
+        # 대부분의 항목에는 괄호가 없으므로 '(' 가 있을 때만 정규식 실행
+        # (호출부에서 이미 strip된 항목만 넘어온다)
+        if '(' in item:
+            item = _PAREN_TAIL.sub('', item).strip()
 
         # 끝에 붙은 마침표 제거
         item = item.rstrip('.')
 
         return item
+
+
+@lru_cache(maxsize=None)
+def _ignorecase_sections() -> tuple[
+    tuple[tuple[re.Pattern, re.Pattern, bool], ...],
+    tuple[tuple[re.Pattern, re.Pattern, bool], ...]
+]:
+    """
+    원문 검색용 (IGNORECASE) 섹션 표 (must_have, nice_to_have)를 반환한다.
+
+    소문자 변환으로 위치가 어긋나는 드문 입력에서만 쓰이므로, import 시점이 아니라
+    처음 필요할 때 한 번만 컴파일한다 (섹션 alternation 컴파일이 import 비용의 대부분).
+    """
+    extractor = RequirementsExtractor
+    return (
+        _build_sections(
+            extractor.MUST_HAVE_STARTERS,
+            extractor.NICE_TO_HAVE_STARTERS,
+            extractor.SECTION_TERMINATORS
+        ),
+        _build_sections(
+            extractor.NICE_TO_HAVE_STARTERS,
+            extractor.MUST_HAVE_STARTERS,
+            extractor.SECTION_TERMINATORS
+        ),
+    )
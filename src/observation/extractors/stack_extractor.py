@@ -15,6 +15,20 @@ import re
 from typing import Optional
 
 from src.observation.extractors.base import BaseExtractor, ExtractResult
+from src.observation.extractors.utils import find_keyword_evidence, lower_preserves_offsets
+
+
+def _needs_word_boundary(keyword: str) -> bool:
+    """
+    단어 경계 검사가 필요한 키워드인지 확인한다.
+
+    특수문자 키워드(c#, c++, .net 등)와 한글 키워드는 단순 포함 여부로 확인한다.
+    """
+    if any(c in keyword for c in ['#', '+', '.']):
+        return False
+    if any('\uac00' <= c <= '\ud7a3' for c in keyword):
+        return False
+    return True
 
 
 class StackExtractor(BaseExtractor):
@@ -23,6 +37,7 @@ class StackExtractor(BaseExtractor):
     name = "stack"
 
     # 언어/프레임워크 키워드 (정규화된 이름으로 매핑)
+    # 값은 코드 상수라 이미 intern되어 있다 - 결과 리스트는 같은 문자열 객체를 공유한다
     STACK_MAP = {
         # Python
         "python": "Python",
@@ -81,60 +96,108 @@ class StackExtractor(BaseExtractor):
         re.IGNORECASE
     )
 
-    def extract(self, normalized_text: str, sentences: list[str]) -> Optional[ExtractResult]:
+    # "Python only" 형식 (명시적 언어 지정)
+    ONLY_PATTERN = re.compile(r'(\w+)\s+only\b', re.IGNORECASE)
+
+    # 단어(\w+) 토큰 - 단어 경계 키워드는 토큰 집합 조회로 확인한다
+    WORD_PATTERN = re.compile(r'\w+')
+
+    # (키워드, 스택, 단어 경계 패턴, evidence 패턴) - 클래스 로드 시 한 번만 컴파일
+    # 단어 경계 패턴은 단어 경계가 필요한 키워드만 만든다 (나머지는 None)
+    KEYWORD_TABLE = tuple(
+        (
+            keyword,
+            stack,
+            re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
+            if _needs_word_boundary(keyword) else None,
+            re.compile(re.escape(keyword), re.IGNORECASE),
+        )
+        for keyword, stack in STACK_MAP.items()
+    )
+
+    def extract(
+        self,
+        normalized_text: str,
+        sentences: list[str],
+        text_lower: Optional[str] = None
+    ) -> Optional[ExtractResult]:
         """텍스트에서 기술 스택 정보를 추출한다."""
 
+        if text_lower is None:
+            text_lower = normalized_text.lower()
+
+        # 소문자 변환으로 단어가 바뀌는 문자('İ' → 'i̇', IGNORECASE와 어긋나는 'ı', 'ſ')가 있으면
+        # text_lower 기반 사전 필터/토큰 집합을 쓰지 않고 원문에서 단어 경계 패턴으로 확인한다
+        lower_is_exact = lower_preserves_offsets(normalized_text, text_lower)
+
+        # 사전 필터: 키워드가 하나도 없으면 추출 불가
+        # ("X only" 패턴도 X가 STACK_MAP 키일 때만 채택하므로)
+        # 결과용 리스트/집합은 필터를 통과한 뒤에만 만든다
+        if lower_is_exact and not any(keyword in text_lower for keyword in self.STACK_MAP):
+            return None
+
         found_stacks: list[str] = []
+        seen: set[str] = set()  # 중복 확인용 (순서는 found_stacks가 유지)
         evidence_parts: list[str] = []
-        text_lower = normalized_text.lower()
 
         # 우선순위가 높은 패턴 (명시적 언어 지정)
         # "Python only", "Python, C# 혼용"
-        only_pattern = re.compile(r'(\w+)\s+only\b', re.IGNORECASE)
-        only_match = only_pattern.search(normalized_text)
+        only_match = self.ONLY_PATTERN.search(normalized_text)
         if only_match:
             candidate = only_match.group(1).lower()
             if candidate in self.STACK_MAP:
-                found_stacks.append(self.STACK_MAP[candidate])
+                stack = self.STACK_MAP[candidate]
+                seen.add(stack)
+                found_stacks.append(stack)
                 evidence_parts.append(only_match.group(0))
 
+        # 텍스트를 한 번만 토큰화 (\bkeyword\b 매칭 = 같은 단어 토큰 존재)
+        words = set(self.WORD_PATTERN.findall(text_lower)) if lower_is_exact else None
+
         # 모든 키워드 스캔
-        for keyword, stack in self.STACK_MAP.items():
+        for keyword, stack, boundary_pattern, evidence_pattern in self.KEYWORD_TABLE:
             # 이미 추가된 스택은 건너뛰기
-            if stack in found_stacks:
+            if stack in seen:
                 continue
 
             # 키워드 검색 (단어 경계 고려)
-            if self._keyword_exists(keyword, text_lower, normalized_text):
+            if self._keyword_exists(keyword, boundary_pattern, text_lower, words, normalized_text):
+                seen.add(stack)
                 found_stacks.append(stack)
-                # evidence 찾기
-                pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-                match = pattern.search(normalized_text)
-                if match:
-                    evidence_parts.append(match.group(0))
+                # evidence 찾기 (소문자 텍스트의 위치로 원문을 잘라 씀)
+                evidence = find_keyword_evidence(
+                    keyword, normalized_text, text_lower, evidence_pattern
+                )
+                if evidence:
+                    evidence_parts.append(evidence)
 
         if not found_stacks:
             return None
 
         return ExtractResult(
-            value=found_stacks,
+            value=tuple(found_stacks),
             confidence=0.9,
             evidence=", ".join(evidence_parts),
             extractor=self.name
         )
 
-    def _keyword_exists(self, keyword: str, text_lower: str, original_text: str) -> bool:
+    def _keyword_exists(
+        self,
+        keyword: str,
+        boundary_pattern: Optional[re.Pattern],
+        text_lower: str,
+        words: Optional[set[str]],
+        original_text: str
+    ) -> bool:
         """키워드가 텍스트에 존재하는지 확인 (단어 경계 고려)"""
 
-        # 특수문자가 포함된 키워드 (c#, c++, .net 등)
-        if any(c in keyword for c in ['#', '+', '.']):
-            return keyword in text_lower
-
-        # 한글 키워드는 단순 포함 여부 확인 (단어 경계 개념이 다름)
-        if any('\uac00' <= c <= '\ud7a3' for c in keyword):
-            return keyword in text_lower
-
-        # 영문 키워드는 단어 경계 확인
+        # 영문 키워드는 단어 경계 확인 (단어 토큰과 정확히 일치해야 함)
         # "py"가 "python"의 일부로 매칭되지 않도록
-        pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
-        return bool(pattern.search(original_text))
+        if boundary_pattern is not None:
+            if words is not None:
+                return keyword in words
+            # 토큰 집합을 쓸 수 없는 입력: 원문에서 단어 경계 패턴으로 확인 (드문 경로)
+            return boundary_pattern.search(original_text) is not None
+
+        # 특수문자/한글 키워드는 단순 포함 여부 확인 (단어 경계 개념이 다름)
+        return keyword in text_lower
@@ -11,9 +11,79 @@ Team Size Extractor
 """
 
 import re
+from types import MappingProxyType
 from typing import Optional, Union
 
 from src.observation.extractors.base import BaseExtractor, ExtractResult
+from src.observation.extractors.utils import lower_preserves_offsets
+
+
+# 사전 필터: 패턴별로 반드시 포함해야 하는 고정 문자열 (소문자 기준, 이 중 하나도 없으면 매칭 불가)
+# 필요한 문자열이 텍스트에 없으면 그 패턴의 search 자체를 건너뛴다.
+# 특히 숫자로 시작하는 패턴은 리터럴 접두어가 없어 텍스트의 모든 숫자 위치에서 매칭을 시도하므로
+# 팀 관련 표현이 없는 입력에서 이 필터로 대부분의 스캔을 생략한다.
+_PATTERN_SENTINELS = {
+    # 범위 패턴
+    "inwin_range": ("인원",),
+    "team_range": ("팀",),
+    "simple_range_ko": ("명",),
+    "range_en": ("people", "person", "developer", "engineer", "member", "ppl"),
+    "team_size_range": ("team",),
+    "team_is_range": ("team",),
+    # 단일값 패턴
+    "inwin_format": ("인원",),
+    "team_format": ("팀",),
+    "developer_format": ("개발자",),
+    "team_of_format": ("team",),
+    "team_size_format": ("team",),
+    "n_developers_format": ("developer", "engineer", "member", "people", "person"),
+    "ppl_format": ("ppl",),
+    "n_myung_context": ("명",),
+    "simple_myung": ("명",),
+}
+
+# 부분 투입/담당 제외 패턴도 모두 "명"을 요구한다
+_EXCLUSION_SENTINEL = "명"
+
+# 위 고정 문자열 전체 (텍스트마다 한 번만 포함 여부를 확인한다)
+_ALL_SENTINELS = tuple(dict.fromkeys(
+    [sentinel for sentinels in _PATTERN_SENTINELS.values() for sentinel in sentinels]
+    + [_EXCLUSION_SENTINEL]
+))
+
+
+def _ascii_search(pattern: re.Pattern):
+    """
+    영어 전용 패턴(패턴 문자열이 ASCII)의 re.ASCII 버전 search를 반환한다.
+
+    ASCII 텍스트에서는 \\s, \\d, IGNORECASE가 유니코드 모드와 같은 결과를 내므로
+    유니코드 문자 범주 조회가 없는 ASCII 모드로 검색한다.
+    한글이 들어간 패턴은 ASCII 텍스트에서 매칭될 수 없으므로 원래 search를 그대로 쓴다.
+    """
+    if not pattern.pattern.isascii():
+        return pattern.search
+    return re.compile(pattern.pattern, (pattern.flags & ~re.UNICODE) | re.ASCII).search
+
+
+# 패턴별 기본 신뢰도 (호출마다 dict를 새로 만들지 않도록 모듈 상수로 둔다)
+_RANGE_CONFIDENCE = {
+    "inwin_range": 0.95,
+    "team_range": 0.95,
+    "simple_range_ko": 0.85,
+    "range_en": 0.9,
+    "team_size_range": 0.9,
+}
+_SINGLE_CONFIDENCE = {
+    "inwin_format": 0.95,
+    "team_format": 0.95,
+    "developer_format": 0.9,
+    "team_of_format": 0.9,
+    "team_size_format": 0.95,
+    "n_developers_format": 0.85,
+    "ppl_format": 0.85,
+    "n_myung_context": 0.8,
+    "simple_myung": 0.6,
+}
 
 
 class TeamSizeExtractor(BaseExtractor):
@@ -21,25 +91,30 @@ class TeamSizeExtractor(BaseExtractor):
 
     name = "team_size"
 
+    # 사전 필터: 모든 범위/단일값 패턴은 숫자를 요구한다
+    TRIGGER_PATTERN = re.compile(r"\d")
+
+    # 숫자 뒤에는 숫자가 올 수 없는 토큰만 오므로 \d+ 는 possessive(\d++)로 두어 역추적을 막는다
+
     # === 범위 패턴 (우선순위 높음) ===
     RANGE_PATTERNS = [
         # "인원은 2~3명", "인원 2-3명"
         (
-            re.compile(r"인원[은이가]?\s*(\d+)\s*[~\-]\s*(\d+)\s*명", re.IGNORECASE),
+            re.compile(r"인원[은이가]?\s*(\d++)\s*[~\-]\s*(\d++)\s*명", re.IGNORECASE),
             lambda m: {"min": int(m.group(1)), "max": int(m.group(2))},
             "inwin_range"
         ),
 
         # "팀 2~3명", "팀은 2-3명"
         (
-            re.compile(r"팀[은이가]?\s*(\d+)\s*[~\-]\s*(\d+)\s*명", re.IGNORECASE),
+            re.compile(r"팀[은이가]?\s*(\d++)\s*[~\-]\s*(\d++)\s*명", re.IGNORECASE),
             lambda m: {"min": int(m.group(1)), "max": int(m.group(2))},
             "team_range"
         ),
 
         # "2~3명", "2-3명" (일반)
         (
-            re.compile(r"(\d+)\s*[~\-]\s*(\d+)\s*명", re.IGNORECASE),
+            re.compile(r"(\d++)\s*[~\-]\s*(\d++)\s*명", re.IGNORECASE),
             lambda m: {"min": int(m.group(1)), "max": int(m.group(2))},
             "simple_range_ko"
         ),
@@ -47,7 +122,7 @@ class TeamSizeExtractor(BaseExtractor):
         # "2 to 3 people", "2-3 people", "2~3 developers"
         (
             re.compile(
-                r"(\d+)\s*(?:to|~|\-)\s*(\d+)\s*(?:people|persons?|developers?|engineers?|members?|ppl)",
+                r"(\d++)\s*(?:to|~|\-)\s*(\d++)\s*(?:people|persons?|developers?|engineers?|members?|ppl)",
                 re.IGNORECASE
             ),
             lambda m: {"min": int(m.group(1)), "max": int(m.group(2))},
@@ -56,14 +131,14 @@ class TeamSizeExtractor(BaseExtractor):
 
         # "team size 2-3", "team of 2~3"
         (
-            re.compile(r"team\s+(?:size|of)\s+(\d+)\s*[~\-]\s*(\d+)", re.IGNORECASE),
+            re.compile(r"team\s+(?:size|of)\s+(\d++)\s*[~\-]\s*(\d++)", re.IGNORECASE),
             lambda m: {"min": int(m.group(1)), "max": int(m.group(2))},
             "team_size_range"
         ),
 
         # "team is 2~5", "team is 2-5"
         (
-            re.compile(r"team\s+is\s+(\d+)\s*[~\-]\s*(\d+)", re.IGNORECASE),
+            re.compile(r"team\s+is\s+(\d++)\s*[~\-]\s*(\d++)", re.IGNORECASE),
             lambda m: {"min": int(m.group(1)), "max": int(m.group(2))},
             "team_is_range"
         ),
@@ -73,56 +148,56 @@ class TeamSizeExtractor(BaseExtractor):
     SINGLE_PATTERNS = [
         # "인원은 2명", "인원이 3명", "인원 5명"
         (
-            re.compile(r"인원[은이가]?\s*(\d+)\s*명", re.IGNORECASE),
+            re.compile(r"인원[은이가]?\s*(\d++)\s*명", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "inwin_format"
         ),
 
         # "팀은 3명", "팀이 5명", "팀 2명"
         (
-            re.compile(r"팀[은이가]?\s*(\d+)\s*명", re.IGNORECASE),
+            re.compile(r"팀[은이가]?\s*(\d++)\s*명", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "team_format"
         ),
 
         # "개발자 5명", "개발자는 3명"
         (
-            re.compile(r"개발자[는은이가]?\s*(\d+)\s*명", re.IGNORECASE),
+            re.compile(r"개발자[는은이가]?\s*(\d++)\s*명", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "developer_format"
         ),
 
         # "team of 5", "team of 3 people"
         (
-            re.compile(r"team\s+of\s+(\d+)", re.IGNORECASE),
+            re.compile(r"team\s+of\s+(\d++)", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "team_of_format"
         ),
 
         # "Team size will be 4 people", "team size 5"
         (
-            re.compile(r"team\s+size\s+(?:will\s+be\s+|is\s+)?(\d+)", re.IGNORECASE),
+            re.compile(r"team\s+size\s+(?:will\s+be\s+|is\s+)?(\d++)", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "team_size_format"
         ),
 
         # "5 developers", "3 engineers", "2 members", "4 people"
         (
-            re.compile(r"(\d+)\s*(?:developers?|engineers?|members?|people|persons?)", re.IGNORECASE),
+            re.compile(r"(\d++)\s*(?:developers?|engineers?|members?|people|persons?)", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "n_developers_format"
         ),
 
         # "5 ppl", "3ppl"
         (
-            re.compile(r"(\d+)\s*ppl", re.IGNORECASE),
+            re.compile(r"(\d++)\s*ppl", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "ppl_format"
         ),
 
         # "5명이고", "3명 정도", "2명으로" (문맥에서 팀 관련일 때)
         (
-            re.compile(r"(\d+)\s*명\s*(?:이고|정도|으로|이서|이라)", re.IGNORECASE),
+            re.compile(r"(\d++)\s*명\s*(?:이고|정도|으로|이서|이라)", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "n_myung_context"
         ),
@@ -130,7 +205,7 @@ class TeamSizeExtractor(BaseExtractor):
         # 단순 "N명" (앞에 시간 단위가 없을 때만, 부분 투입 제외)
         # "담당 1명", "포함" 등 부분 투입 컨텍스트 제외
         (
-            re.compile(r"(?<![\d])(?<!담당\s)(\d+)\s*명(?!\s*(?:개월|달|주|일|년))(?!.*포함)", re.IGNORECASE),
+            re.compile(r"(?<![\d])(?<!담당\s)(\d++)\s*명(?!\s*(?:개월|달|주|일|년))(?!.*포함)", re.IGNORECASE),
             lambda m: int(m.group(1)),
             "simple_myung"
         ),
@@ -138,27 +213,45 @@ class TeamSizeExtractor(BaseExtractor):
 
     # 부분 투입/담당 제외 패턴 (이 패턴에 매칭되면 팀 사이즈가 아님)
     EXCLUSION_PATTERNS = [
-        re.compile(r"담당\s*\d+\s*명", re.IGNORECASE),
-        re.compile(r"\d+\s*명\s*(?:포함|투입|배정|배치)", re.IGNORECASE),
+        re.compile(r"담당\s*\d++\s*명", re.IGNORECASE),
+        re.compile(r"\d++\s*명\s*(?:포함|투입|배정|배치)", re.IGNORECASE),
     ]
 
+    # 패턴의 search 메서드를 미리 바인딩 (루프 내 속성 조회 생략)
+    # (search, ASCII 텍스트용 search, 변환 함수, 패턴 이름, 필요한 고정 문자열)
+    RANGE_SEARCHES = tuple(
+        (pattern.search, _ascii_search(pattern), converter, pattern_name, _PATTERN_SENTINELS[pattern_name])
+        for pattern, converter, pattern_name in RANGE_PATTERNS
+    )
+    SINGLE_SEARCHES = tuple(
+        (pattern.search, _ascii_search(pattern), converter, pattern_name, _PATTERN_SENTINELS[pattern_name])
+        for pattern, converter, pattern_name in SINGLE_PATTERNS
+    )
+    EXCLUSION_SEARCHES = tuple(pattern.search for pattern in EXCLUSION_PATTERNS)
+
     # 팀 관련 컨텍스트 키워드
     CONTEXT_KEYWORDS = [
         "팀", "team", "인원", "인력", "개발자", "developer", "engineer",
         "member", "people", "ppl", "명"
     ]
 
-    def extract(self, normalized_text: str, sentences: list[str]) -> Optional[ExtractResult]:
+    def extract(
+        self,
+        normalized_text: str,
+        sentences: list[str],
+        text_lower: Optional[str] = None
+    ) -> Optional[ExtractResult]:
         """
         텍스트에서 팀 인원 정보를 추출한다.
 
         Returns:
             ExtractResult with:
             - value=int (단일값) 또는
-            - value={"min": int, "max": int} (범위)
+            - value={"min": int, "max": int} (범위, 읽기 전용 MappingProxyType)
         """
         # 전체 텍스트에서 먼저 시도 (범위 우선)
-        result = self._extract_from_text(normalized_text)
+        # 전체 텍스트의 소문자 변환은 Observer가 공유한 text_lower를 재사용한다
+        result = self._extract_from_text(normalized_text, text_lower)
         if result:
             return result
 
@@ -170,12 +263,34 @@ class TeamSizeExtractor(BaseExtractor):
 
         return None
 
-    def _extract_from_text(self, text: str) -> Optional[ExtractResult]:
+    def _extract_from_text(
+        self,
+        text: str,
+        text_lower: Optional[str] = None
+    ) -> Optional[ExtractResult]:
         """단일 텍스트에서 추출 시도 (범위 패턴 우선)"""
 
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # 0. 사전 필터: 텍스트에 있는 고정 문자열을 한 번만 모아 두고,
+        #    패턴마다 필요한 문자열이 없으면 search를 건너뛴다 (하나도 없으면 어떤 패턴도 매칭 불가)
+        #    소문자 변환과 IGNORECASE 매칭이 어긋나는 문자가 있으면 필터를 쓰지 않는다.
+        if lower_preserves_offsets(text, text_lower):
+            present = {sentinel for sentinel in _ALL_SENTINELS if sentinel in text_lower}
+            if not present:
+                return None
+        else:
+            present = None
+
+        # ASCII 텍스트는 영어 패턴을 re.ASCII 버전으로 검색한다 (isascii()는 O(1) 플래그 확인)
+        is_ascii = text.isascii()
+
         # 1. 범위 패턴 먼저 시도 (부분 투입 체크 전에)
-        for pattern, converter, pattern_name in self.RANGE_PATTERNS:
-            match = pattern.search(text)
+        for search, ascii_search, converter, pattern_name, sentinels in self.RANGE_SEARCHES:
+            if present is not None and present.isdisjoint(sentinels):
+                continue
+            match = ascii_search(text) if is_ascii else search(text)
             if match:
                 try:
                     value = converter(match)
@@ -184,10 +299,12 @@ class TeamSizeExtractor(BaseExtractor):
                     if not self._validate_range(value):
                         continue
 
-                    confidence = self._calculate_confidence(pattern_name, text, match, is_range=True)
+                    confidence = self._calculate_confidence(
+                        pattern_name, text, match, is_range=True, text_lower=text_lower
+                    )
 
                     return ExtractResult(
-                        value=value,
+                        value=MappingProxyType(value),
                         confidence=confidence,
                         evidence=match.group(),
                         extractor=self.name
@@ -195,14 +312,17 @@ class TeamSizeExtractor(BaseExtractor):
                 except (ValueError, IndexError):
                     continue
 
-        # 2. 부분 투입/담당 패턴이면 단일값 추출 스킵
-        for excl_pattern in self.EXCLUSION_PATTERNS:
-            if excl_pattern.search(text):
-                return None
+        # 2. 부분 투입/담당 패턴이면 단일값 추출 스킵 (두 패턴 모두 "명"을 요구)
+        if present is None or _EXCLUSION_SENTINEL in present:
+            for excl_search in self.EXCLUSION_SEARCHES:
+                if excl_search(text):
+                    return None
 
         # 3. 단일값 패턴 시도
-        for pattern, converter, pattern_name in self.SINGLE_PATTERNS:
-            match = pattern.search(text)
+        for search, ascii_search, converter, pattern_name, sentinels in self.SINGLE_SEARCHES:
+            if present is not None and present.isdisjoint(sentinels):
+                continue
+            match = ascii_search(text) if is_ascii else search(text)
             if match:
                 try:
                     team_size = converter(match)
@@ -211,7 +331,9 @@ class TeamSizeExtractor(BaseExtractor):
                     if team_size < 1 or team_size > 1000:
                         continue
 
-                    confidence = self._calculate_confidence(pattern_name, text, match, is_range=False)
+                    confidence = self._calculate_confidence(
+                        pattern_name, text, match, is_range=False, text_lower=text_lower
+                    )
 
                     return ExtractResult(
                         value=team_size,
@@ -244,33 +366,19 @@ class TeamSizeExtractor(BaseExtractor):
         pattern_name: str,
         text: str,
         match,
-        is_range: bool
+        is_range: bool,
+        text_lower: Optional[str] = None
     ) -> float:
         """패턴 유형과 컨텍스트에 따른 신뢰도 계산"""
 
         if is_range:
-            base_confidence = {
-                "inwin_range": 0.95,
-                "team_range": 0.95,
-                "simple_range_ko": 0.85,
-                "range_en": 0.9,
-                "team_size_range": 0.9,
-            }.get(pattern_name, 0.8)
+            base_confidence = _RANGE_CONFIDENCE.get(pattern_name, 0.8)
         else:
-            base_confidence = {
-                "inwin_format": 0.95,
-                "team_format": 0.95,
-                "developer_format": 0.9,
-                "team_of_format": 0.9,
-                "team_size_format": 0.95,
-                "n_developers_format": 0.85,
-                "ppl_format": 0.85,
-                "n_myung_context": 0.8,
-                "simple_myung": 0.6,
-            }.get(pattern_name, 0.5)
-
-        # 컨텍스트 키워드가 있으면 신뢰도 보정
-        text_lower = text.lower()
+            base_confidence = _SINGLE_CONFIDENCE.get(pattern_name, 0.5)
+
+        # 컨텍스트 키워드가 있으면 신뢰도 보정 (소문자 텍스트가 없을 때만 변환)
+        if text_lower is None:
+            text_lower = text.lower()
         context_bonus = 0.0
         for keyword in self.CONTEXT_KEYWORDS:
             if keyword in text_lower:
@@ -5,6 +5,8 @@ evidence 문자열 후처리 등 추출기 공통 기능
 """
 
 import re
+from functools import lru_cache
+from typing import Optional
 
 
 def truncate_at_word_boundary(text: str, max_len: int = 100) -> str:
@@ -26,6 +28,101 @@ def truncate_at_word_boundary(text: str, max_len: int = 100) -> str:
     return truncated.rstrip() + '…'
 
 
+# IGNORECASE로는 ASCII 소문자와 매칭되지만 lower() 결과는 다른 문자
+# ('İ'는 lower() 시 길이가 바뀌므로 길이 비교로 걸러진다)
+_CASE_FOLD_MISMATCH = ('\u0131', '\u017f')  # 'ı', 'ſ'
+
+
+def lower_preserves_offsets(text: str, text_lower: str) -> bool:
+    """
+    소문자 텍스트에서 (IGNORECASE 없이) 찾은 매칭 위치를 원문에 그대로 쓸 수 있는지 확인한다.
+
+    길이가 같고, IGNORECASE 매칭과 lower() 결과가 어긋나는 문자가 없으면
+    소문자 패턴 + text_lower 검색 결과가 IGNORECASE 패턴 + 원문 검색 결과와 같다.
+    """
+    if len(text_lower) != len(text):
+        return False
+    return not any(char in text_lower for char in _CASE_FOLD_MISMATCH)
+
+
+def find_keyword_evidence(
+    keyword: str,
+    text: str,
+    text_lower: str,
+    pattern: re.Pattern
+) -> Optional[str]:
+    """
+    원문에서 keyword(소문자)가 처음 나오는 부분을 원래 대소문자 그대로 반환한다.
+
+    소문자 텍스트의 위치를 원문에 그대로 쓸 수 있으면 (lower_preserves_offsets)
+    str.find 결과로 원문을 잘라 쓴다. 아니면 pattern(IGNORECASE)으로 찾는다.
+    """
+    if lower_preserves_offsets(text, text_lower):
+        start = text_lower.find(keyword)
+        if start < 0:
+            return None
+        return text[start:start + len(keyword)]
+
+    match = pattern.search(text)
+    return match.group(0) if match else None
+
+
+# === format_evidence 패턴 (모듈 로드 시 한 번만 컴파일) ===
+
+_PUNCT_SPACING = re.compile(r'([:;,\)\]\}])(?=[^\s\.:;,\)\]\}])')
+
+# 한글 조사/연결어 (원래 긴 패턴부터 순서대로 치환하던 목록)
+#   '그리고', '하지만', '또는', '에서', '으로', '이고', '이며', '로는',
+#   '은', '는', '이', '가', '을', '를', '에', '로', '과', '와', '및'
+# 조사 뒤에 공백 없이 글자가 바로 오면 조사 뒤에 공백을 넣는다.
+# 순서대로 치환한 결과는 "조사로 끝나는 위치 뒤에 글자가 오면 공백" 과 같으므로
+# 조사의 마지막 글자 하나를 소비하는 패턴 하나로 합친다.
+# - '또는', '으로', '로는' 은 마지막 글자('는', '로')가 단일 조사이므로 단일 조사로 처리된다
+# - 나머지 여러 글자 조사는 마지막 글자 뒤에서 lookbehind로 전체를 확인한다
+#   (이들 조사 내부에는 앞선 조사 치환으로 공백이 들어갈 수 없다)
+_PARTICLE_PATTERN = re.compile(
+    r'([은는이가을를에로과와및]|[고만](?<=그리고|하지만)|[서고며](?<=에서|이고|이며))'
+    r'(?=[가-힣a-zA-Z0-9])'
+)
+
+# 영문 동사/구문
+# 단어 경계(\b) 대신 lookaround 사용: 앞에 영문자가 없어야 하고, 뒤에 영문자가 바로 오면 공백 삽입
+# 단, 일반적인 접미사(ment, ments, s, d, ing 등)가 바로 오면 단어 내부로 판단하여 제외
+_ENGLISH_CONNECTORS = (
+    'includes', 'included', 'include',
+    'requires', 'required', 'require',
+    'indicates', 'means',
+    'being', 'been', 'were', 'was', 'are', 'is', 'be'
+)
+# 앞에 영문자 없음 + connector + 접미사가 아닌 영문자
+# 접미사 패턴: ment/ments (requirement), s/d/ed/ing, tion/tions, able/ible/ly
+# 앞선 치환이 공백을 넣으면 뒤 연결어의 lookbehind/접미사 판정이 달라지므로 순서대로 치환한다.
+# (연결어, 패턴) - 공백 삽입은 새 연결어를 만들지 못하므로, 처음 문자열에 없는 연결어는 건너뛴다.
+_CONNECTOR_PATTERNS = tuple(
+    (
+        connector,
+        re.compile(
+            rf'(?<![a-zA-Z])({connector})(?!(?:ment|ments|s|d|ed|ing|tion|tions|able|ible|ly)(?:[^a-zA-Z]|$))(?=[a-zA-Z])',
+            re.IGNORECASE
+        ),
+    )
+    for connector in _ENGLISH_CONNECTORS
+)
+
+# 조사/연결어 치환 사전 필터
+_HANGUL = re.compile(r'[가-힣]')
+# 연결어 패턴의 lookahead와 같은 문자 집합 (IGNORECASE에서는 'ſ', 'K' 등도 포함)
+_ASCII_LETTER = re.compile(r'[a-zA-Z]', re.IGNORECASE)
+
+_DIGIT_ALPHA = re.compile(r'(\d)(?=[a-zA-Z])')
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+
+# format_evidence 결과 캐시 크기 (같은 evidence 문자열은 재처리하지 않음)
+EVIDENCE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=EVIDENCE_CACHE_SIZE)
 def format_evidence(text: str) -> str:
     """
     Evidence 문자열을 사람이 읽기 자연스럽게 후처리한다.
@@ -49,40 +146,30 @@ def format_evidence(text: str) -> str:
     # 1) 구두점 뒤 공백 보장: :, ;, ,, ), ], }
     # 구두점 뒤에 공백이 없고 다음이 글자/숫자면 공백 삽입
     # lookahead로 "공백 없이 글자가 오는 경우"만 처리
-    result = re.sub(r'([:;,\)\]\}])(?=[^\s\.:;,\)\]\}])', r'\1 ', result)
+    result = _PUNCT_SPACING.sub(r'\1 ', result)
 
     # 2) 한글 조사/연결어 뒤 공백 보장 (lookaround 기반)
     # 조사 뒤에 공백 없이 바로 글자(한글/영문/숫자)가 오면 공백 삽입
-    korean_particles = [
-        '그리고', '하지만', '또는', '에서', '으로', '이고', '이며', '로는',
-        '은', '는', '이', '가', '을', '를', '에', '로', '과', '와', '및'
-    ]
-    # 긴 패턴부터 매칭 (로는 before 로, 에서 before 에)
-    for particle in korean_particles:
-        # 조사 뒤에 공백 없이 글자가 바로 오는 경우
-        pattern = rf'({re.escape(particle)})(?=[가-힣a-zA-Z0-9])'
-        result = re.sub(pattern, r'\1 ', result)
+    # (조사는 모두 한글이므로 한글이 없으면 건너뜀)
+    if _HANGUL.search(result):
+        result = _PARTICLE_PATTERN.sub(r'\1 ', result)
 
     # 3) 영문 동사/구문 뒤 공백 보장 (lookaround 기반)
-    # 단어 경계(\b) 대신 lookaround 사용: 앞에 영문자가 없어야 하고, 뒤에 영문자가 바로 오면 공백 삽입
-    # 단, 일반적인 접미사(ment, ments, s, d, ing 등)가 바로 오면 단어 내부로 판단하여 제외
-    english_connectors = [
-        'includes', 'included', 'include',
-        'requires', 'required', 'require',
-        'indicates', 'means',
-        'being', 'been', 'were', 'was', 'are', 'is', 'be'
-    ]
-    for connector in english_connectors:
-        # 앞에 영문자 없음 + connector + 접미사가 아닌 영문자
-        # 접미사 패턴: ment/ments (requirement), s/d/ed/ing, tion/tions, able/ible/ly
-        pattern = rf'(?<![a-zA-Z])({connector})(?!(?:ment|ments|s|d|ed|ing|tion|tions|able|ible|ly)(?:[^a-zA-Z]|$))(?=[a-zA-Z])'
-        result = re.sub(pattern, r'\1 ', result, flags=re.IGNORECASE)
+    # (뒤에 영문자가 와야 하므로 영문자가 없으면 건너뜀)
+    if _ASCII_LETTER.search(result):
+        result_lower = result.lower()
+        # IGNORECASE와 소문자 변환이 어긋나는 문자가 있으면 포함 여부로 거르지 않는다
+        check_presence = lower_preserves_offsets(result, result_lower)
+        for connector, pattern in _CONNECTOR_PATTERNS:
+            if check_presence and connector not in result_lower:
+                continue
+            result = pattern.sub(r'\1 ', result)
 
     # 숫자-단위 붙임 분리 (표시용): 6months → 6 months
-    result = re.sub(r'(\d)(?=[a-zA-Z])', r'\1 ', result)
+    result = _DIGIT_ALPHA.sub(r'\1 ', result)
 
     # 4) 연속 공백을 1칸으로 축소
-    result = re.sub(r'\s+', ' ', result)
+    result = _WHITESPACE_RUN.sub(' ', result)
 
     # 4) 앞뒤 공백 trim
     result = result.strip()
@@ -11,23 +11,27 @@ Observer 파이프라인 오케스트레이터
 LLM 없이 rule-based로만 동작한다.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
-
-from src.observation.schema import ObservationResult, Unknown, ExtractResult
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from src.observation.schema import (
+    LOW_CONFIDENCE_THRESHOLD,
+    ExtractResult,
+    ObservationResult,
+    RequirementsResult,
+    Unknown,
+)
 from src.observation.normalizer import normalize, NormalizeResult
-from src.observation.extractors.deadline_extractor import DeadlineExtractor
-from src.observation.extractors.team_extractor import TeamSizeExtractor
-from src.observation.extractors.requirements_extractor import RequirementsExtractor, RequirementsResult
-from src.observation.extractors.platform_extractor import PlatformExtractor
-from src.observation.extractors.stack_extractor import StackExtractor
-from src.observation.extractors.forbidden_extractor import ForbiddenExtractor
+from src.observation.extractors.base import BaseExtractor
 from src.observation.unknowns.generator import generate_unknowns
 
 
 # === Legacy Observation (DEPRECATED) ===
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """
     [DEPRECATED] 사용자 입력에서 추출한 관찰 결과
@@ -46,17 +50,35 @@ class Observation:
 
 # === Extractor Registry ===
 
-EXTRACTORS = [
-    DeadlineExtractor(),
-    TeamSizeExtractor(),
-    RequirementsExtractor(),
-    PlatformExtractor(),
-    StackExtractor(),
-    ForbiddenExtractor(),
-]
+# 실행 순서가 곧 결과 순서이므로 읽기 전용 tuple로 둔다
+# 추출기 모듈은 import 시점에 정규식을 컴파일하므로(observer import 비용의 대부분),
+# 레지스트리는 처음 추출할 때 만든다 (None이면 아직 만들지 않음)
+_EXTRACTORS: Optional[tuple[BaseExtractor, ...]] = None
+
+
+def _build_extractors() -> tuple[BaseExtractor, ...]:
+    """추출기 모듈을 import해 레지스트리를 만든다."""
+    from src.observation.extractors.deadline_extractor import DeadlineExtractor
+    from src.observation.extractors.team_extractor import TeamSizeExtractor
+    from src.observation.extractors.requirements_extractor import RequirementsExtractor
+    from src.observation.extractors.platform_extractor import PlatformExtractor
+    from src.observation.extractors.stack_extractor import StackExtractor
+    from src.observation.extractors.forbidden_extractor import ForbiddenExtractor
+
+    return (
+        DeadlineExtractor(),
+        TeamSizeExtractor(),
+        RequirementsExtractor(),
+        PlatformExtractor(),
+        StackExtractor(),
+        ForbiddenExtractor(),
+    )
 
 
 # === 불확실성 키워드 ===
+# 소문자 텍스트에서 부분 문자열로 찾는다 (토큰 단위 비교가 아님).
+# 한글은 어간/어근만 적어 활용형까지 잡는다: "아마"→"아마도", "모르"→"모르겠다", "검토"→"검토중"
+# 따라서 단어 토큰 집합과의 교집합으로 바꾸면 이런 입력을 놓친다.
 
 UNCERTAINTY_KEYWORDS = [
     # 영어 불확실 표현
@@ -75,21 +97,87 @@ UNCERTAINTY_KEYWORDS = [
 ]
 
 
+# 누락 시 모호성 점수를 올리는 핵심 추출기
+CRITICAL_EXTRACTORS = frozenset({"deadline", "team_size"})
+
+
+# === 컴플라이언스/운영제약 신호 (모호성 점수 tie-breaker) ===
+
+COMPLIANCE_SIGNALS_EN = [
+    "no internet", "offline", "security", "compliance", "production", "forbidden",
+]
+COMPLIANCE_SIGNALS_KO = [
+    "인터넷 불가", "오프라인", "보안", "컴플라이언스", "운영", "현장", "프로덕션", "금지",
+]
+
+# 소문자 텍스트에서 신호 존재 여부를 한 번의 스캔으로 확인한다.
+# 한글 신호는 공백 변화에도 잡히도록 글자 사이에 공백(' ')을 허용한다
+# (기존의 "공백 제거 텍스트에 공백 제거 신호가 있는지" 검사와 같은 조건).
+_COMPLIANCE_PATTERN = re.compile('|'.join(
+    [re.escape(signal) for signal in COMPLIANCE_SIGNALS_EN]
+    + [' *'.join(map(re.escape, signal.replace(' ', ''))) for signal in COMPLIANCE_SIGNALS_KO]
+))
+
+
 # === Pipeline Functions ===
 
+# 추출 결과 캐시 크기 (동일 입력 반복 시 추출기 재실행 생략)
+EXTRACT_CACHE_SIZE = 256
+
+# 프로세스 풀 일괄 처리 시 작업 하나에 묶는 입력 수 (프로세스 간 통신 비용 분산)
+BATCH_CHUNK_SIZE = 64
+
+
 def _run_extractors(
     normalized_text: str,
     sentences: list[str]
 ) -> list[ExtractResult]:
     """모든 추출기를 실행하고 결과를 수집한다."""
-    results: list[ExtractResult] = []
+    return list(_run_extractors_cached(normalized_text, tuple(sentences)))
+
 
-    for extractor in EXTRACTORS:
-        result = extractor.extract(normalized_text, sentences)
+@lru_cache(maxsize=EXTRACT_CACHE_SIZE)
+def _run_extractors_cached(
+    normalized_text: str,
+    sentences: tuple[str, ...]
+) -> tuple[ExtractResult, ...]:
+    """
+    추출기 실행 결과를 (정규화 텍스트, 문장) 단위로 캐시한다.
+
+    추출기는 입력에만 의존하는 순수 함수이므로 결과를 재사용할 수 있다.
+    ExtractResult와 그 value는 불변이므로 여러 호출이 그대로 공유한다.
+    """
+    global _EXTRACTORS
+    if _EXTRACTORS is None:
+        _EXTRACTORS = _build_extractors()
+
+    results: list[ExtractResult] = []
+    # 소문자 변환은 추출기마다 반복하지 않고 한 번만 수행
+    text_lower = normalized_text.lower()
+    sentence_list = list(sentences)
+    # 추출기 간 공유하는 사전 필터 결과 (deadline/team_size는 같은 숫자 필터를 쓴다)
+    # 추출기 패턴 전체를 하나의 alternation으로 합치지 않는 이유:
+    # 추출기마다 패턴 우선순위와 첫 매칭 규칙이 다르고, 합치면 리터럴 접두어 최적화도 사라진다.
+    trigger_hits: dict = {}
+
+    for extractor in _EXTRACTORS:
+        # 사전 필터에 걸리지 않으면 개별 패턴 스캔을 생략
+        if not extractor.may_match(normalized_text, trigger_hits):
+            continue
+        result = extractor.extract(normalized_text, sentence_list, text_lower)
         if result:
             results.append(result)
 
-    return results
+    return tuple(results)
+
+
+def clear_extraction_cache() -> None:
+    """
+    추출 결과 캐시를 비운다.
+
+    추출기 구성이나 패턴을 런타임에 바꾼 뒤 호출한다.
+    """
+    _run_extractors_cached.cache_clear()
 
 
 def _calculate_ambiguity_score(
@@ -97,7 +185,9 @@ def _calculate_ambiguity_score(
     extractions: list[ExtractResult],
     unknowns: list[Unknown],
     must_have_count: int = 0,
-    nice_to_have_count: int = 0
+    nice_to_have_count: int = 0,
+    text_lower: Optional[str] = None,
+    extractor_names: Optional[Iterable[str]] = None
 ) -> int:
     """
     모호성 점수 계산 (0~100)
@@ -118,30 +208,30 @@ def _calculate_ambiguity_score(
     # unknowns 개수 (최대 30점, 항목당 15점)
     score += min(30, len(unknowns) * 15)
 
-    # 불확실 키워드 카운트
-    text_lower = text.lower()
+    # 불확실 키워드 카운트 (소문자 텍스트는 observe_v2에서 한 번만 계산해 전달)
+    if text_lower is None:
+        text_lower = text.lower()
+    # 키워드끼리 겹치므로 키워드별 포함 여부를 센다
     uncertainty_count = sum(1 for kw in UNCERTAINTY_KEYWORDS if kw in text_lower)
 
     # 키워드 점수 (점진적 증가, 최대 30점)
-    # 1-2개: 각 3점, 3-4개: 각 4점, 5개+: 각 5점
-    keyword_score = 0
-    for i in range(uncertainty_count):
-        if i < 2:
-            keyword_score += 3
-        elif i < 4:
-            keyword_score += 4
-        else:
-            keyword_score += 5
+    # 1-2개: 각 3점, 3-4개: 각 4점, 5개+: 각 5점 (구간별 개수로 바로 계산)
+    keyword_score = (
+        3 * min(uncertainty_count, 2)
+        + 4 * min(max(uncertainty_count - 2, 0), 2)
+        + 5 * max(uncertainty_count - 4, 0)
+    )
     score += min(30, keyword_score)
 
     # 핵심 추출기(deadline, team_size) 누락 시 가산점 (최대 20점)
-    extractor_names = {e.extractor for e in extractions}
-    critical_extractors = {"deadline", "team_size"}
-    missing_critical = len(critical_extractors - extractor_names)
+    # (추출기 이름 목록은 observe_v2가 이미 만든 색인을 전달받아 재사용)
+    if extractor_names is None:
+        extractor_names = {e.extractor for e in extractions}
+    missing_critical = len(CRITICAL_EXTRACTORS.difference(extractor_names))
     score += missing_critical * 10
 
     # 낮은 신뢰도 추출 (최대 20점)
-    low_confidence_count = sum(1 for e in extractions if e.confidence < 0.7)
+    low_confidence_count = sum(1 for e in extractions if e.confidence < LOW_CONFIDENCE_THRESHOLD)
     score += min(20, low_confidence_count * 10)
 
     # 구조화된 요구사항이 풍부하면 감점 (명확한 입력으로 판단)
@@ -151,29 +241,12 @@ def _calculate_ambiguity_score(
         score -= 15
 
     # 컴플라이언스/운영제약 신호가 있으면 +5 (tie-breaker)
-    compliance_signals_en = [
-        "no internet", "offline", "security", "compliance", "production", "forbidden",
-    ]
-    compliance_signals_ko = [
-        "인터넷 불가", "오프라인", "보안", "컴플라이언스", "운영", "현장", "프로덕션", "금지",
-    ]
-    # 한글은 공백 변화에도 안정적으로 잡히도록 공백 제거 버전도 검사
-    text_compact = text_lower.replace(" ", "")
-    has_compliance = (
-        any(sig in text_lower for sig in compliance_signals_en) or
-        any(sig in text_lower or sig.replace(" ", "") in text_compact for sig in compliance_signals_ko)
-    )
-    if has_compliance:
+    if _COMPLIANCE_PATTERN.search(text_lower):
         score += 5
 
     return max(0, min(100, score))
 
 
-def _extract_requirements(sentences: list[str]) -> list[str]:
-    """문장에서 요구사항을 추출한다."""
-    return [s for s in sentences if s.strip()]
-
-
 # === Main Pipeline ===
 
 def observe_v2(user_input: str) -> ObservationResult:
@@ -188,7 +261,7 @@ def observe_v2(user_input: str) -> ObservationResult:
     5. Validate   : unknowns 생성
     """
     # 빈 입력 처리
-    if not user_input or not user_input.strip():
+    if not user_input or user_input.isspace():
         return ObservationResult(
             raw_input=user_input,
             unknowns=[Unknown(
@@ -219,30 +292,45 @@ def observe_v2(user_input: str) -> ObservationResult:
     language_stack: list[str] = []
     forbidden: list[str] = []
 
-    for extraction in extractions:
-        if extraction.extractor == "deadline":
-            deadline_days = extraction.value
-        elif extraction.extractor == "team_size":
-            # 범위인지 단일값인지 확인
-            if isinstance(extraction.value, dict):
-                # 범위 입력: team_size는 None, min/max만 설정
-                team_size_min = extraction.value.get("min")
-                team_size_max = extraction.value.get("max")
-                team_range_evidence = extraction.evidence
-            else:
-                # 단일값 입력
-                team_size = extraction.value
-        elif extraction.extractor == "requirements":
-            # RequirementsResult에서 must_have, nice_to_have 추출
-            if isinstance(extraction.value, RequirementsResult):
-                must_have = extraction.value.must_have
-                nice_to_have = extraction.value.nice_to_have
-        elif extraction.extractor == "platform":
-            platform = extraction.value
-        elif extraction.extractor == "stack":
-            language_stack = extraction.value if isinstance(extraction.value, list) else [extraction.value]
-        elif extraction.extractor == "forbidden":
-            forbidden = extraction.value if isinstance(extraction.value, list) else [extraction.value]
+    # 추출기 이름으로 한 번만 색인하고 필드별로 조회한다 (추출기당 결과는 최대 1개)
+    extraction_by_name = {extraction.extractor: extraction for extraction in extractions}
+
+    extraction = extraction_by_name.get("deadline")
+    if extraction:
+        deadline_days = extraction.value
+
+    extraction = extraction_by_name.get("team_size")
+    if extraction:
+        # 범위인지 단일값인지 확인
+        if isinstance(extraction.value, Mapping):
+            # 범위 입력: team_size는 None, min/max만 설정
+            team_size_min = extraction.value.get("min")
+            team_size_max = extraction.value.get("max")
+            team_range_evidence = extraction.evidence
+        else:
+            # 단일값 입력
+            team_size = extraction.value
+
+    extraction = extraction_by_name.get("requirements")
+    # RequirementsResult에서 must_have, nice_to_have 추출
+    if extraction and isinstance(extraction.value, RequirementsResult):
+        must_have = list(extraction.value.must_have)
+        nice_to_have = list(extraction.value.nice_to_have)
+
+    extraction = extraction_by_name.get("platform")
+    if extraction:
+        platform = extraction.value
+
+    extraction = extraction_by_name.get("stack")
+    if extraction:
+        language_stack = list(extraction.value) if isinstance(extraction.value, tuple) else [extraction.value]
+
+    extraction = extraction_by_name.get("forbidden")
+    if extraction:
+        forbidden = list(extraction.value) if isinstance(extraction.value, tuple) else [extraction.value]
+
+    # 소문자 변환은 unknowns 생성/점수화에서 공유 (입력 길이만큼의 복사를 한 번만)
+    user_input_lower = user_input.lower()
 
     # 4. Validate & Generate Unknowns
     unknowns = generate_unknowns(
@@ -252,7 +340,8 @@ def observe_v2(user_input: str) -> ObservationResult:
         team_size,
         team_size_min,
         team_size_max,
-        team_range_evidence
+        team_range_evidence,
+        text_lower=user_input_lower
     )
 
     # 5. Quantify
@@ -260,12 +349,15 @@ def observe_v2(user_input: str) -> ObservationResult:
     ambiguity_score = _calculate_ambiguity_score(
         user_input, extractions, unknowns,
         must_have_count=len(must_have),
-        nice_to_have_count=len(nice_to_have)
+        nice_to_have_count=len(nice_to_have),
+        text_lower=user_input_lower,
+        extractor_names=extraction_by_name.keys()
     )
 
     # 요구사항: 추출된 항목이 없으면 문장으로 fallback
+    # (normalize의 문장 목록은 이미 strip되고 빈 문장이 제거된 새 리스트이므로 그대로 쓴다)
     if not must_have:
-        must_have = _extract_requirements(sentences)
+        must_have = sentences
 
     return ObservationResult(
         raw_input=user_input,
@@ -286,7 +378,85 @@ def observe_v2(user_input: str) -> ObservationResult:
     )
 
 
-def observe(user_input: str) -> Observation:
+def batch_observe_v2(
+    texts: Iterable[str],
+    max_workers: Optional[int] = None
+) -> list[ObservationResult]:
+    """
+    여러 입력을 한 번에 관찰한다 (평가 하네스/일괄 처리용).
+
+    동일한 입력은 파이프라인을 한 번만 실행하고, 중복 위치에는 결과의 복사본을 준다
+    (위치마다 독립적인 객체이므로 한 결과를 수정해도 다른 위치에 영향이 없다).
+    반환 순서는 입력 순서와 같다.
+
+    Args:
+        texts: 입력 텍스트들
+        max_workers: 2 이상이면 프로세스 풀로 나눠 실행한다 (re 매칭은 GIL을
+                     놓지 않으므로 스레드가 아닌 프로세스를 쓴다).
+                     None이면 현재 프로세스에서 순차 실행한다.
+    """
+    texts = list(texts)
+    unique_texts = list(dict.fromkeys(texts))
+
+    if max_workers is not None and max_workers > 1 and len(unique_texts) > 1:
+        # 프로세스 생성/직렬화 비용이 있으므로 큰 배치에서만 이득이다
+        # (multiprocessing 관련 import도 이 경로에서만 필요하므로 여기서 불러온다)
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            unique_results = list(
+                executor.map(observe_v2, unique_texts, chunksize=BATCH_CHUNK_SIZE)
+            )
+    else:
+        unique_results = [observe_v2(text) for text in unique_texts]
+
+    results_by_text = dict(zip(unique_texts, unique_results))
+    results: list[ObservationResult] = []
+    handed_out: set[str] = set()
+    for text in texts:
+        result = results_by_text[text]
+        if text in handed_out:
+            result = _copy_observation(result)
+        else:
+            handed_out.add(text)
+        results.append(result)
+    return results
+
+
+def _copy_observation(result: ObservationResult) -> ObservationResult:
+    """
+    결과에서 호출자가 수정할 수 있는 부분만 복사한다 (batch_observe_v2의 중복 위치용).
+
+    deepcopy보다 훨씬 싸다. ExtractResult와 그 value는 불변이므로 그대로 공유한다.
+    """
+    return replace(
+        result,
+        must_have=list(result.must_have),
+        nice_to_have=list(result.nice_to_have),
+        interfaces=list(result.interfaces),
+        language_stack=list(result.language_stack),
+        forbidden=list(result.forbidden),
+        unknowns=[replace(unknown) for unknown in result.unknowns],
+        extractions=list(result.extractions),
+    )
+
+
+# 일수 → 표시 단위 (기준 일수, 단위) - 큰 단위부터, 해당 없으면 일 단위
+_DEADLINE_UNITS = ((365, "년"), (30, "개월"), (7, "주"))
+
+
+def _format_deadline(days: int) -> str:
+    """일수를 가장 큰 단위로 표시한다 (년 단위는 남은 개월 수를 덧붙임)."""
+    for unit_days, unit in _DEADLINE_UNITS:
+        if days >= unit_days:
+            count, rest = divmod(days, unit_days)
+            if unit == "년" and rest >= 30:
+                return f"{count}년 {rest // 30}개월"
+            return f"{count}{unit}"
+    return f"{days}일"
+
+
+def observe(user_input: str, result: Optional[ObservationResult] = None) -> Observation:
     """
     [DEPRECATED] 하위 호환용 observe 함수
 
@@ -296,8 +466,13 @@ def observe(user_input: str) -> Observation:
 
     기존 Reasoner/Proposer가 사용하던 Observation 형식으로 반환.
     내부적으로는 observe_v2를 사용. v3.0에서 제거 예정.
+
+    Args:
+        user_input: 사용자 입력 텍스트
+        result: 같은 입력으로 이미 실행한 observe_v2 결과 (있으면 파이프라인 재실행 생략)
     """
-    result = observe_v2(user_input)
+    if result is None:
+        result = observe_v2(user_input)
 
     # ObservationResult → Observation 변환
     constraints: list[str] = []
@@ -308,23 +483,7 @@ def observe(user_input: str) -> Observation:
         constraints.append(f"[인력] 팀 {result.team_size_min}~{result.team_size_max}명 (확정 필요)")
 
     if result.deadline_days is not None:
-        # 일수를 적절한 단위로 변환
-        days = result.deadline_days
-        if days >= 365:
-            years = days // 365
-            months = (days % 365) // 30
-            if months > 0:
-                constraints.append(f"[일정] {years}년 {months}개월")
-            else:
-                constraints.append(f"[일정] {years}년")
-        elif days >= 30:
-            months = days // 30
-            constraints.append(f"[일정] {months}개월")
-        elif days >= 7:
-            weeks = days // 7
-            constraints.append(f"[일정] {weeks}주")
-        else:
-            constraints.append(f"[일정] {days}일")
+        constraints.append(f"[일정] {_format_deadline(result.deadline_days)}")
 
     # Step2 추출값 반영: 플랫폼/스택/금지
     if result.platform:
@@ -336,7 +495,7 @@ def observe(user_input: str) -> Observation:
     if result.forbidden:
         constraints.append(f"[금지] {', '.join(result.forbidden)} (운영)")
 
-    # 운영제약 신호 추출 (텍스트에서 직접)
+    # 운영제약 신호 추출 (텍스트에서 직접, 소문자 변환은 이 함수에서 한 번만)
     text_lower = user_input.lower()
     operational_constraints = []
 
@@ -345,12 +504,16 @@ def observe(user_input: str) -> Observation:
         operational_constraints.append("WSL2 개발환경")
 
     # 인터넷/오프라인 제약
-    if "no internet" in text_lower or "인터넷 불가" in text_lower or "인터넷불가" in text_lower:
+    # (고정 문자열 몇 개의 포함 여부는 str의 in 검사가 하나의 alternation 정규식 스캔보다 훨씬 빠르다)
+    no_internet = (
+        "no internet" in text_lower or "인터넷 불가" in text_lower or "인터넷불가" in text_lower
+    )
+    if no_internet:
         operational_constraints.append("인터넷 불가")
     if "offline" in text_lower or "오프라인" in text_lower:
         if "offline update" in text_lower or "오프라인 업데이트" in text_lower:
             operational_constraints.append("오프라인 업데이트만 가능")
-        elif "인터넷 불가" not in " ".join(operational_constraints):
+        elif not no_internet:
             operational_constraints.append("오프라인 환경")
 
     # 보안/컴플라이언스
@@ -369,7 +532,7 @@ def observe(user_input: str) -> Observation:
 
     return Observation(
         raw_input=user_input,
-        requirements=result.must_have,
+        requirements=list(result.must_have),
         constraints=constraints,
         unknowns=unknowns_str,
     )
@@ -6,7 +6,14 @@ Reasoner/Proposer는 이 구조 데이터만 사용한다.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, NamedTuple, Optional
+
+
+# 이 값 미만의 confidence는 "낮은 신뢰도"로 취급한다 (unknowns 생성, 모호성 점수, Reasoner 경고)
+LOW_CONFIDENCE_THRESHOLD = 0.7
+
+# 이 값 미만의 confidence가 하나라도 있으면 Analysis.warnings에 신뢰도 경고를 남긴다
+WARNING_CONFIDENCE_THRESHOLD = 0.80
 
 
 @dataclass
@@ -17,15 +24,31 @@ class Unknown:
     evidence: str      # 입력 중 관련 문장/근거
 
 
-@dataclass
-class ExtractResult:
-    """개별 추출기의 결과"""
-    value: any                     # 추출된 값
+class ExtractResult(NamedTuple):
+    """
+    개별 추출기의 결과
+
+    추출기마다 생성되는 작은 불변 레코드이므로 NamedTuple로 둔다.
+    (extractors.base에서도 이 타입을 그대로 사용한다)
+
+    추출 결과는 캐시되어 여러 호출이 공유하므로 value도 불변 값
+    (int/str/tuple/MappingProxyType/frozen dataclass)으로 둔다.
+    """
+    value: Any                     # 추출된 값 (None이면 추출 실패)
     confidence: float              # 0.0 ~ 1.0
     evidence: str                  # 추출 근거 (원문)
     extractor: str = ""            # 추출기 이름
 
 
+@dataclass(slots=True, frozen=True)
+class RequirementsResult:
+    """요구사항 추출 결과 (추출 완료 후 한 번에 생성, 이후 변경하지 않음)"""
+    must_have: tuple[str, ...]
+    nice_to_have: tuple[str, ...]
+    must_have_evidence: str = ""
+    nice_to_have_evidence: str = ""
+
+
 @dataclass
 class ObservationResult:
     """
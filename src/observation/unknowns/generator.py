@@ -10,7 +10,19 @@ Unknowns Generator
 import re
 from typing import Optional
 
-from src.observation.schema import Unknown, ExtractResult
+from src.observation.schema import LOW_CONFIDENCE_THRESHOLD, Unknown, ExtractResult
+
+
+# 공백을 제거한 텍스트에서의 포함 여부와 같은 조건 (글자 사이 공백 허용)
+# - 공백 제거 사본을 만들지 않고 소문자 텍스트에서 바로 찾는다
+_SECSGEM_SPACED = re.compile(r's *e *c *s *g *e *m')
+_NO_INTERNET_SPACED = re.compile(r'인 *터 *넷 *불 *가')
+
+# 팀 인원 선호값 패턴 ("ideally N" / "prefer N" 은 소문자 텍스트, 한글은 원문에서 검색)
+_IDEALLY_PATTERN = re.compile(r'ideally\s+(\d+)')
+_PREFERRED_PATTERN = re.compile(r'prefer(?:red|s)?\s+(\d+)')
+_KOREAN_PREFERRED_PATTERN = re.compile(r'(?:선호|이상적)[^\d]*(\d+)')
+_PREFERRED_KEYWORDS = ("ideally", "preferred", "best", "선호", "가능하면", "이상적")
 
 
 def generate_unknowns(
@@ -20,7 +32,8 @@ def generate_unknowns(
     team_size: Optional[int],
     team_size_min: Optional[int] = None,
     team_size_max: Optional[int] = None,
-    team_range_evidence: str = ""
+    team_range_evidence: str = "",
+    text_lower: Optional[str] = None
 ) -> list[Unknown]:
     """
     미확인 정보(unknowns) 자동 생성
@@ -30,8 +43,12 @@ def generate_unknowns(
     - 추출 confidence < 임계값
     - 팀 인원이 범위로 입력된 경우
     - 키워드 기반 도메인 특화 질문
+
+    text_lower는 text.lower() (호출 측에서 이미 계산했으면 전달, None이면 여기서 계산)
     """
     unknowns: list[Unknown] = []
+    if text_lower is None:
+        text_lower = text.lower()
 
     # deadline 누락
     if deadline_days is None:
@@ -44,7 +61,7 @@ def generate_unknowns(
     # team_size 범위인 경우 (확정 필요)
     if team_size_min is not None and team_size_max is not None:
         question = _generate_team_range_question(
-            text, team_size_min, team_size_max
+            text, team_size_min, team_size_max, text_lower
         )
         unknowns.append(Unknown(
             question=question,
@@ -61,7 +78,7 @@ def generate_unknowns(
 
     # 낮은 신뢰도 추출 결과
     for extraction in extractions:
-        if extraction.confidence < 0.7:
+        if extraction.confidence < LOW_CONFIDENCE_THRESHOLD:
             unknowns.append(Unknown(
                 question=f"{extraction.extractor} 정보가 정확한가요? (추출: {extraction.evidence})",
                 reason="추출 신뢰도가 낮습니다.",
@@ -69,18 +86,20 @@ def generate_unknowns(
             ))
 
     # 키워드 기반 추가 unknowns (우선순위 높은 확인 사항)
-    _add_keyword_based_unknowns(text, unknowns)
+    _add_keyword_based_unknowns(text_lower, unknowns)
 
     return unknowns
 
 
-def _add_keyword_based_unknowns(text: str, unknowns: list[Unknown]) -> None:
-    """키워드 기반 도메인 특화 질문 추가"""
-    text_lower = text.lower()
-    text_compact = text_lower.replace(" ", "")
+def _add_keyword_based_unknowns(text_lower: str, unknowns: list[Unknown]) -> None:
+    """
+    키워드 기반 도메인 특화 질문 추가 (text_lower: 소문자 변환된 입력)
 
+    트리거는 고정 문자열 포함 여부(in)로 확인한다. 입력 길이에서는 키워드 전체를
+    named group alternation 하나로 합친 finditer 스캔보다 개별 in 검사가 훨씬 빠르다.
+    """
     # SECS/GEM 프로토콜
-    if "secs/gem" in text_lower or "secs gem" in text_lower or "secsgem" in text_compact:
+    if "secs/gem" in text_lower or "secs gem" in text_lower or _SECSGEM_SPACED.search(text_lower):
         unknowns.append(Unknown(
             question="SECS/GEM 연동 대상 장비와 메시지 규격이 확정되었나요?",
             reason="SECS/GEM은 장비별로 메시지 구조가 다를 수 있어 사전 확인이 필요합니다.",
@@ -111,7 +130,7 @@ def _add_keyword_based_unknowns(text: str, unknowns: list[Unknown]) -> None:
         ))
 
     # No internet / 오프라인 / Offline update
-    if "no internet" in text_lower or "인터넷 불가" in text_lower or "인터넷불가" in text_compact:
+    if "no internet" in text_lower or "인터넷 불가" in text_lower or _NO_INTERNET_SPACED.search(text_lower):
         unknowns.append(Unknown(
             question="인터넷 불가 환경에서 소프트웨어 배포/업데이트 방식이 정해져 있나요?",
             reason="오프라인 환경은 배포 파이프라인 설계에 영향을 줍니다.",
@@ -145,7 +164,8 @@ def _add_keyword_based_unknowns(text: str, unknowns: list[Unknown]) -> None:
 def _generate_team_range_question(
     text: str,
     team_size_min: int,
-    team_size_max: int
+    team_size_max: int,
+    text_lower: Optional[str] = None
 ) -> str:
     """
     팀 인원 범위에 대한 확인 질문을 생성한다.
@@ -153,26 +173,20 @@ def _generate_team_range_question(
     입력에 "ideally", "preferred", "선호" 등의 표현이 있으면
     해당 nuance를 반영한 질문을 생성한다.
     """
-    text_lower = text.lower()
-
-    # 선호값 추출 패턴
-    preferred_value = None
-    preferred_keywords = ["ideally", "preferred", "best", "선호", "가능하면", "이상적"]
-
-    # "ideally N" 또는 "선호 N명" 패턴 검색
-    ideally_pattern = re.search(r'ideally\s+(\d+)', text_lower)
-    preferred_pattern = re.search(r'prefer(?:red|s)?\s+(\d+)', text_lower)
-    korean_pattern = re.search(r'(?:선호|이상적)[^\d]*(\d+)', text)
-
-    if ideally_pattern:
-        preferred_value = int(ideally_pattern.group(1))
-    elif preferred_pattern:
-        preferred_value = int(preferred_pattern.group(1))
-    elif korean_pattern:
-        preferred_value = int(korean_pattern.group(1))
-
-    # 선호 키워드가 있는지 확인
-    has_preference = any(kw in text_lower for kw in preferred_keywords)
+    if text_lower is None:
+        text_lower = text.lower()
+
+    # 선호값 추출: "ideally N" > "prefer(red) N" > "선호/이상적 ... N" 우선순위
+    # (union 패턴의 leftmost 매칭은 우선순위가 달라지므로 합치지 않고,
+    #  앞 패턴이 매칭되면 뒤 패턴은 검색하지 않으며, 키워드가 없으면 검색 자체를 생략)
+    preferred_match = None
+    if "ideally" in text_lower:
+        preferred_match = _IDEALLY_PATTERN.search(text_lower)
+    if preferred_match is None and "prefer" in text_lower:
+        preferred_match = _PREFERRED_PATTERN.search(text_lower)
+    if preferred_match is None and ("선호" in text or "이상적" in text):
+        preferred_match = _KOREAN_PREFERRED_PATTERN.search(text)
+    preferred_value = int(preferred_match.group(1)) if preferred_match else None
 
     # 질문 생성
     if preferred_value and team_size_min <= preferred_value <= team_size_max:
@@ -181,7 +195,8 @@ def _generate_team_range_question(
             f"이상적으로는 {preferred_value}명을 선호하는 것으로 보입니다. "
             f"초기 기준 인원을 {preferred_value}명으로 확정해도 될까요?"
         )
-    elif has_preference:
+    elif any(kw in text_lower for kw in _PREFERRED_KEYWORDS):
+        # 선호 키워드는 있지만 범위 안의 선호값은 없음
         return (
             f"팀 인원은 {team_size_min}~{team_size_max}명 범위로 보입니다. "
             f"선호하는 인원 규모가 있다면, 그 기준으로 확정해도 될까요?"
@@ -12,7 +12,11 @@ v2: 입력 특성에 따라 Pros/Cons가 달라지는 규칙 추가
 
 from dataclasses import dataclass, field
 
-from src.observation.schema import ObservationResult
+from src.observation.schema import (
+    LOW_CONFIDENCE_THRESHOLD,
+    WARNING_CONFIDENCE_THRESHOLD,
+    ObservationResult,
+)
 from src.reasoning.rules.base import RuleContext
 from src.reasoning.rules.engine import RuleEngine
 from src.reasoning.rules.budget_rule import BudgetConstraintRule
@@ -47,11 +51,20 @@ VOLATILITY_KEYWORDS = [
 
 # NOTE: BUDGET_TIGHT_KEYWORDS는 src/reasoning/rules/budget_rule.py로 이관됨
 
+# === Rule Engine (규칙은 상태가 없으므로 모듈 로드 시 한 번만 구성) ===
+# 등록 순서가 cons/constraints 추가 순서이므로 순서를 바꾸지 않는다
+
+_RULE_ENGINE = (
+    RuleEngine()
+    .register(BudgetConstraintRule())
+    .register(TeamSizeRule())
+    .register(DeadlineRule())
+    .register(VolatilityRule())
+)
 
-def _detect_ambiguity_level(text: str, result: ObservationResult) -> str:
-    """모호성 수준 감지: HIGH / MEDIUM / LOW"""
-    text_lower = text.lower()
 
+def _detect_ambiguity_level(text_lower: str, result: ObservationResult) -> str:
+    """모호성 수준 감지: HIGH / MEDIUM / LOW"""
     # unknowns가 많으면 HIGH
     if len(result.unknowns) >= 3:
         return "HIGH"
@@ -67,9 +80,8 @@ def _detect_ambiguity_level(text: str, result: ObservationResult) -> str:
     return "LOW"
 
 
-def _detect_scope_volatility(text: str) -> bool:
+def _detect_scope_volatility(text_lower: str) -> bool:
     """범위 변동성 감지"""
-    text_lower = text.lower()
     return any(kw in text_lower for kw in VOLATILITY_KEYWORDS)
 
 
@@ -94,10 +106,11 @@ def reason(result: ObservationResult) -> Analysis:
     v2: 입력 특성에 따라 Pros/Cons가 달라지는 규칙 기반 분석
     v2.1: Rule Engine Lite 도입 (BudgetConstraintRule)
     """
-    text = result.raw_input
+    # 소문자 변환은 한 번만 하고 키워드 분석과 Rule Engine이 공유한다
+    text_lower = result.raw_input.lower()
 
     # === 모호성 수준 분석 ===
-    ambiguity_level = _detect_ambiguity_level(text, result)
+    ambiguity_level = _detect_ambiguity_level(text_lower, result)
 
     # === Rule Engine 컨텍스트 초기화 ===
     ctx = RuleContext(
@@ -106,9 +119,13 @@ def reason(result: ObservationResult) -> Analysis:
         pros=[],
         cons=[],
         assumptions=[],
-        constraints=list(_build_constraints(result)),  # 기존 제약 조건으로 초기화
+        constraints=_build_constraints(result, text_lower),  # 기존 제약 조건으로 초기화
+        text_lower=text_lower,
     )
 
+    # 범위 변동성 (cons와 assumptions에서 함께 사용)
+    scope_volatile = _detect_scope_volatility(text_lower)
+
     # === Pros 생성 (조건부) ===
     if result.must_have:
         # 모호성이 낮을 때만 "요구사항 명확" 문구 사용
@@ -135,17 +152,12 @@ def reason(result: ObservationResult) -> Analysis:
         ctx.cons.append("명확화 과정 없이 진행 시 범위 초과(scope creep) 가능성이 큽니다.")
 
     # 범위 변동성 감지
-    if _detect_scope_volatility(text):
+    if scope_volatile:
         ctx.cons.append("요구사항이 변동 중이므로 유연한 아키텍처가 필요합니다.")
         ctx.cons.append("범위 변경 가능성으로 인해 초기 설계 시 여유분 확보가 필요합니다.")
 
     # === Rule Engine 실행 ===
-    engine = RuleEngine()
-    engine.register(BudgetConstraintRule())
-    engine.register(TeamSizeRule())
-    engine.register(DeadlineRule())
-    engine.register(VolatilityRule())
-    engine.run(ctx)
+    _RULE_ENGINE.run(ctx)
 
     # 팀 규모 불확실
     if _detect_team_uncertainty(result):
@@ -169,15 +181,21 @@ def reason(result: ObservationResult) -> Analysis:
         ctx.assumptions.append("요구사항이 구체화되면 분석을 재수행해야 합니다.")
         ctx.assumptions.append("현재 분석은 잠정적 방향 설정 용도입니다.")
 
-    if _detect_scope_volatility(text):
+    if scope_volatile:
         ctx.assumptions.append("요구사항 변동에 대응할 수 있는 유연성이 필요합니다.")
 
+    # 낮은 신뢰도 추출 결과 (assumptions 경고와 warnings 필드 기준을 한 번의 순회로 확인)
+    low_confidence_names: list[str] = []
+    has_low_confidence = False
+    for extraction in result.extractions:
+        if extraction.confidence < LOW_CONFIDENCE_THRESHOLD:
+            low_confidence_names.append(extraction.extractor)
+        if extraction.confidence < WARNING_CONFIDENCE_THRESHOLD:
+            has_low_confidence = True
+
     # 낮은 신뢰도 추출 결과 경고
-    low_confidence_extractions = [
-        e for e in result.extractions if e.confidence < 0.7
-    ]
-    if low_confidence_extractions:
-        names = ", ".join(e.extractor for e in low_confidence_extractions)
+    if low_confidence_names:
+        names = ", ".join(low_confidence_names)
         ctx.assumptions.append(
             f"[주의] 일부 추출 결과({names})의 신뢰도가 낮아 확인이 필요합니다."
         )
@@ -190,7 +208,6 @@ def reason(result: ObservationResult) -> Analysis:
 
     # === Warnings 생성 (구조화 필드) ===
     warnings: list[str] = []
-    has_low_confidence = any(e.confidence < 0.80 for e in result.extractions)
     if has_low_confidence:
         warnings.append("일부 추출 결과의 신뢰도가 낮습니다. 추가 확인이 필요합니다.")
 
@@ -203,8 +220,8 @@ def reason(result: ObservationResult) -> Analysis:
     )
 
 
-def _build_constraints(result: ObservationResult) -> list[str]:
-    """ObservationResult에서 제약 조건 목록 생성"""
+def _build_constraints(result: ObservationResult, text_lower: str) -> list[str]:
+    """ObservationResult에서 제약 조건 목록 생성 (text_lower: raw_input의 소문자 텍스트)"""
     constraints: list[str] = []
 
     # 인력 제약
@@ -245,7 +262,15 @@ def _build_constraints(result: ObservationResult) -> list[str]:
         constraints.append(f"[금지] {', '.join(result.forbidden)} (운영)")
 
     # 운영제약 (텍스트에서 직접 추출)
-    text_lower = result.raw_input.lower()
+    operational = _detect_operational_constraints(text_lower)
+    if operational:
+        constraints.append(f"[운영제약] {', '.join(operational)}")
+
+    return constraints
+
+
+def _detect_operational_constraints(text_lower: str) -> list[str]:
+    """소문자 텍스트에서 운영제약 목록 추출"""
     operational = []
 
     if "wsl" in text_lower or "wsl2" in text_lower:
@@ -264,7 +289,4 @@ def _build_constraints(result: ObservationResult) -> list[str]:
     if "compliance" in text_lower or "컴플라이언스" in text_lower:
         operational.append("컴플라이언스 요구")
 
-    if operational:
-        constraints.append(f"[운영제약] {', '.join(operational)}")
-
-    return constraints
+    return operational
@@ -5,7 +5,7 @@ Rule 인터페이스 정의
 """
 
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Optional, Protocol
 
 from src.observation.schema import ObservationResult
 
@@ -27,6 +27,13 @@ class RuleContext:
     assumptions: list[str] = field(default_factory=list)
     constraints: list[str] = field(default_factory=list)
 
+    # 소문자 입력 텍스트 (규칙마다 raw_input.lower()를 반복하지 않도록 한 번만 계산)
+    text_lower: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.text_lower is None:
+            self.text_lower = self.result.raw_input.lower()
+
 
 class Rule(Protocol):
     """
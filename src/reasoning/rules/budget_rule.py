@@ -31,8 +31,7 @@ class BudgetConstraintRule:
 
     def applies(self, ctx: RuleContext) -> bool:
         """예산 제약 키워드가 있으면 적용"""
-        text_lower = ctx.result.raw_input.lower()
-        return any(kw in text_lower for kw in BUDGET_TIGHT_KEYWORDS)
+        return any(kw in ctx.text_lower for kw in BUDGET_TIGHT_KEYWORDS)
 
     def apply(self, ctx: RuleContext) -> None:
         """예산 제약 관련 cons와 constraints 추가"""
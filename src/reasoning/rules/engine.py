@@ -4,6 +4,8 @@ Rule Engine Lite
 여러 규칙을 순서대로 적용하는 간단한 엔진입니다.
 """
 
+from typing import Callable
+
 from src.reasoning.rules.base import Rule, RuleContext
 
 
@@ -17,6 +19,10 @@ class RuleEngine:
 
     def __init__(self) -> None:
         self._rules: list[Rule] = []
+        # 등록 시점에 바인딩한 (applies, apply) 메서드 - run()에서 규칙마다 속성 조회를 반복하지 않음
+        self._dispatch: list[
+            tuple[Callable[[RuleContext], bool], Callable[[RuleContext], None]]
+        ] = []
 
     def register(self, rule: Rule) -> "RuleEngine":
         """
@@ -26,6 +32,7 @@ class RuleEngine:
             self (체이닝 가능)
         """
         self._rules.append(rule)
+        self._dispatch.append((rule.applies, rule.apply))
         return self
 
     def run(self, ctx: RuleContext) -> RuleContext:
@@ -38,9 +45,9 @@ class RuleEngine:
         Returns:
             수정된 컨텍스트
         """
-        for rule in self._rules:
-            if rule.applies(ctx):
-                rule.apply(ctx)
+        for applies, apply in self._dispatch:
+            if applies(ctx):
+                apply(ctx)
 
         return ctx
 
@@ -41,8 +41,7 @@ class VolatilityRule:
             return True
 
         # 케이스 2: 키워드 기반 (fallback)
-        text_lower = result.raw_input.lower()
-        if any(kw in text_lower for kw in VOLATILITY_KEYWORDS):
+        if any(kw in ctx.text_lower for kw in VOLATILITY_KEYWORDS):
             return True
 
         return False
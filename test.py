@@ -13,6 +13,7 @@ import json
 import argparse
 from datetime import datetime
 from pathlib import Path
+from collections.abc import Mapping
 from dataclasses import asdict
 
 from src.observation.observer import observe_v2
@@ -36,8 +37,9 @@ def _serialize_extraction_value(value):
     if hasattr(value, '__dataclass_fields__'):
         # dataclass인 경우 (RequirementsResult 등)
         return asdict(value)
-    elif isinstance(value, dict):
-        return value
+    elif isinstance(value, Mapping):
+        # 팀 규모 범위 (읽기 전용 MappingProxyType)
+        return dict(value)
     else:
         return value
 
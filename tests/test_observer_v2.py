@@ -73,6 +73,11 @@ class TestTeamSizeExtraction:
         result = observe_v2("we have 5 ppl")
         assert result.team_size == 5
 
+    def test_english_pattern_on_non_ascii_digits(self):
+        """ASCII가 아닌 텍스트는 유니코드 모드 패턴으로 검색 (전각 숫자도 인식)"""
+        assert observe_v2("team of 3 developers").team_size == 3
+        assert observe_v2("team of ３ developers").team_size == 3
+
 
 class TestMixedLanguageInput:
     """한영 혼합 입력 테스트"""
@@ -141,6 +146,15 @@ class TestAmbiguityScore:
         # 필수 정보 누락 + 불확실 키워드
         assert result.ambiguity_score > 30
 
+    def test_compliance_signal_tolerates_spaces(self):
+        """한글 컴플라이언스 신호는 글자 사이 공백이 있어도 +5"""
+        from src.observation.observer import _calculate_ambiguity_score
+
+        base = _calculate_ambiguity_score("일반 입력", [], [])
+        assert _calculate_ambiguity_score("인터넷불가 환경", [], []) == base + 5
+        assert _calculate_ambiguity_score("보 안 점검", [], []) == base + 5
+        assert _calculate_ambiguity_score("No Internet", [], []) == base + 5
+
 
 class TestEmptyInput:
     """빈 입력 처리 테스트"""
@@ -451,6 +465,21 @@ Nice features include reporting dashboard and export 기능."""
         assert "API 연동" in result.must_have
         assert "데이터 저장" in result.must_have
 
+    def test_korean_sections_marked_and_skipped_without_hangul(self):
+        """한글 키워드 섹션은 한글 필요로 표시되고, 영어 입력 결과는 그대로"""
+        from src.observation.extractors.requirements_extractor import RequirementsExtractor
+
+        needs_hangul = {
+            starter.pattern: needs
+            for starter, _, needs in RequirementsExtractor.MUST_HAVE_SECTIONS_LOWER
+        }
+        assert needs_hangul[r'must[\s\-]?have\s*:'] is False
+        assert needs_hangul[r'필수(?:\s*기능)?[은는]?\s*[:：]?'] is True
+
+        result = observe_v2("Must have: Login, Search. Optional: Dark mode")
+        assert result.must_have == ["Login", "Search"]
+        assert result.nice_to_have == ["Dark mode"]
+
 
 class TestPlatformExtraction:
     """플랫폼 추출 테스트 (STEP 2)"""
@@ -528,6 +557,11 @@ class TestStackExtraction:
         assert "Python" in result.language_stack
         assert "Java" in result.language_stack
 
+    def test_length_changing_lowercase_keeps_word_boundaries(self):
+        """소문자 변환 시 새 단어가 생기는 문자('İ')가 붙어 있으면 단어 경계 키워드로 보지 않음"""
+        assert observe_v2("İpython 팀, İjs 모듈").language_stack == []
+        assert observe_v2("İstanbul 팀, Python only").language_stack == ["Python"]
+
 
 class TestForbiddenExtraction:
     """금지 사항 추출 테스트 (STEP 2)"""
@@ -594,3 +628,209 @@ Target environment is Linux (WSL) and Python only."""
         assert result.platform == "Linux"
         assert "Python" in result.language_stack
         assert "LLM" in result.forbidden
+
+
+class TestExtractorTrigger:
+    """추출기 사전 필터(TRIGGER_PATTERN) 테스트"""
+
+    def test_trigger_skips_extractor_without_digits(self):
+        """숫자가 없으면 deadline/team_size 추출기는 건너뛴다"""
+        from src.observation.extractors import DeadlineExtractor, TeamSizeExtractor
+
+        text = "Platform은 Windows 기반입니다"
+        assert not DeadlineExtractor().may_match(text)
+        assert not TeamSizeExtractor().may_match(text)
+
+    def test_trigger_does_not_change_result(self):
+        """사전 필터 통과 시 기존 추출 결과와 동일"""
+        from src.observation.extractors import ForbiddenExtractor
+
+        extractor = ForbiddenExtractor()
+        text = "Target environment is Linux (LLM is forbidden)"
+        assert extractor.may_match(text)
+        assert extractor.extract(text, [text]).value == ("LLM",)
+        assert not extractor.may_match("Python only")
+
+    def test_requirements_and_stack_skip_without_keywords(self):
+        """섹션/스택 키워드가 없으면 요구사항/스택 추출 없음"""
+        from src.observation.extractors import RequirementsExtractor, StackExtractor
+
+        text = "팀은 3명이고 기간은 2개월입니다"
+        assert not RequirementsExtractor().may_match(text)
+        assert StackExtractor().extract(text, [text]) is None
+        assert RequirementsExtractor().may_match("MUST HAVE: A, B")
+
+    def test_shared_trigger_scanned_once(self):
+        """같은 사전 필터를 쓰는 추출기는 trigger_hits로 결과를 공유"""
+        from src.observation.extractors import DeadlineExtractor, TeamSizeExtractor
+
+        text = "팀은 3명, 기간은 2개월"
+        trigger_hits: dict = {}
+        assert DeadlineExtractor().may_match(text, trigger_hits)
+        assert TeamSizeExtractor().may_match(text, trigger_hits)
+        assert list(trigger_hits.values()) == [True]
+
+
+class TestLegacyObserveWithResult:
+    """Legacy observe()에 observe_v2 결과 전달 테스트"""
+
+    def test_precomputed_result_matches_fresh_call(self):
+        """이미 계산한 결과를 넘겨도 동일한 Observation 반환"""
+        text = "인원은 2~3명이고 기간은 2개월, Windows 환경"
+        v2_result = observe_v2(text)
+
+        assert observe(text, result=v2_result) == observe(text)
+
+
+class TestExtractorsLazyImport:
+    """extractors 패키지 지연 import 테스트"""
+
+    def test_lazy_attribute_resolves_to_module_class(self):
+        """패키지 속성은 각 모듈의 클래스와 동일"""
+        import src.observation.extractors as extractors
+        from src.observation.extractors.stack_extractor import StackExtractor
+
+        assert extractors.StackExtractor is StackExtractor
+        assert "StackExtractor" in dir(extractors)
+
+    def test_unknown_attribute_raises(self):
+        """정의되지 않은 속성은 AttributeError"""
+        import src.observation.extractors as extractors
+
+        with pytest.raises(AttributeError):
+            extractors.UnknownExtractor
+
+    def test_observer_import_defers_extractor_modules(self):
+        """observer import만으로는 추출기 모듈을 불러오지 않고, 처음 추출할 때 불러온다"""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys\n"
+            "import src.observation.observer as observer\n"
+            "assert 'src.observation.extractors.requirements_extractor' not in sys.modules\n"
+            "assert observer.observe_v2('팀은 3명, Must have: A, B').must_have == ['A', 'B']\n"
+            "assert 'src.observation.extractors.requirements_extractor' in sys.modules\n"
+        )
+        repo_root = Path(__file__).resolve().parent.parent
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
+
+
+class TestBatchObserve:
+    """batch_observe_v2 일괄 처리 테스트"""
+
+    def test_batch_matches_single_calls(self):
+        """입력 순서대로 observe_v2와 같은 결과 반환"""
+        from src.observation.observer import batch_observe_v2
+
+        texts = ["팀은 3명, 기간은 2개월", "Python only", "팀은 3명, 기간은 2개월"]
+        results = batch_observe_v2(texts)
+
+        assert len(results) == 3
+        assert results[0] == observe_v2(texts[0])
+        assert results[1] == observe_v2(texts[1])
+        # 동일 입력은 한 번만 실행하되, 위치마다 독립적인 결과 객체를 받는다
+        assert results[2] == results[0]
+        assert results[2] is not results[0]
+
+    def test_duplicate_positions_are_independent(self):
+        """중복 입력 위치의 결과를 수정해도 다른 위치에 영향 없음"""
+        from src.observation.observer import batch_observe_v2
+
+        texts = ["Python, C# 혼용. 팀은 3~5명", "Python, C# 혼용. 팀은 3~5명"]
+        results = batch_observe_v2(texts)
+        results[0].language_stack.append("COBOL")
+        results[0].unknowns[0].question = "changed"
+        results[0].extractions.clear()
+
+        assert results[1].language_stack == ["Python", "C#"]
+        assert results[1].unknowns[0].question != "changed"
+        assert results[1].extractions
+
+    def test_batch_with_process_pool(self):
+        """프로세스 풀로 실행해도 순차 실행과 같은 결과"""
+        from src.observation.observer import batch_observe_v2
+
+        texts = ["팀은 3명, 기간은 2개월", "Python only", "LLM is forbidden", "Python only"]
+        results = batch_observe_v2(texts, max_workers=2)
+
+        assert results == batch_observe_v2(texts)
+        assert results[3] == results[1]
+        assert results[3] is not results[1]
+
+
+class TestExtractionCache:
+    """추출 결과 캐시 테스트"""
+
+    def test_mutating_result_does_not_leak_into_cache(self):
+        """결과 리스트를 수정해도 같은 입력의 다음 결과에 영향 없음"""
+        text = "Must have: A, B. Python only. LLM is forbidden"
+        first = observe_v2(text)
+        first.must_have.append("X")
+        first.language_stack.clear()
+        first.forbidden.clear()
+
+        second = observe_v2(text)
+        assert second.must_have == ["A", "B"]
+        assert second.language_stack == ["Python"]
+        assert second.forbidden == ["LLM"]
+
+    def test_cached_extraction_values_are_immutable(self):
+        """추출 캐시가 공유하는 extractions[].value는 수정할 수 없음"""
+        text = "팀은 3~5명, Python, C# 혼용. Must have: A, B"
+        by_name = {e.extractor: e for e in observe_v2(text).extractions}
+
+        assert by_name["stack"].value == ("Python", "C#")
+        assert by_name["requirements"].value.must_have == ("A", "B")
+        with pytest.raises(TypeError):
+            by_name["team_size"].value["max"] = 99
+        with pytest.raises(AttributeError):
+            by_name["requirements"].value.must_have = ()
+
+        # 같은 입력은 추출 캐시의 같은 항목을 쓴다
+        second = observe_v2(text)
+        assert second.language_stack == ["Python", "C#"]
+        assert second.team_size_max == 5
+        assert second.must_have == ["A", "B"]
+
+    def test_repeated_input_returns_fresh_copy(self):
+        """같은 입력을 반복해도 unknowns와 extractions까지 호출마다 새 객체로 반환"""
+        text = "아마 2주 정도? 인원은 미정. Python only. Must have: A, B"
+        first = observe_v2(text)
+        first.unknowns[0].question = "changed"
+        first.unknowns.clear()
+        first.extractions.clear()
+
+        second = observe_v2(text)
+        assert second is not first
+        assert second.unknowns
+        assert second.unknowns[0].question != "changed"
+        assert second.extractions
+
+    def test_clear_extraction_cache(self):
+        """캐시를 비운 뒤에도 같은 결과를 다시 계산"""
+        from src.observation.observer import _run_extractors_cached, clear_extraction_cache
+
+        text = "팀은 4명, Python only"
+        first = observe_v2(text)
+        clear_extraction_cache()
+        assert _run_extractors_cached.cache_info().currsize == 0
+
+        second = observe_v2(text)
+        assert second == first
+
+
+class TestRequirementsCaseInsensitive:
+    """요구사항 섹션 대소문자 무시 검색 테스트"""
+
+    def test_uppercase_section_keywords(self):
+        """대문자 섹션 키워드도 인식하고 항목은 원문 대소문자 유지"""
+        result = observe_v2("MUST HAVE: Login, Search. OPTIONAL: Dark Mode")
+        assert result.must_have == ["Login", "Search"]
+        assert result.nice_to_have == ["Dark Mode"]
+
+    def test_length_changing_lowercase_falls_back(self):
+        """소문자 변환 시 길이가 바뀌는 문자가 있어도 같은 결과"""
+        result = observe_v2("İstanbul 팀. Must have: Login, Search.")
+        assert result.must_have == ["Login", "Search"]
@@ -159,3 +159,19 @@ class TestLowConfidenceWarningPolicy:
 
         assert hasattr(analysis, "warnings"), "Analysis에 warnings 필드가 존재해야 합니다"
         assert isinstance(analysis.warnings, list), "warnings는 list 타입이어야 합니다"
+
+
+class TestRepeatedReasoningPolicy:
+    """반복 분석 정책 테스트"""
+
+    def test_repeated_reason_returns_same_independent_analysis(self) -> None:
+        """같은 입력을 다시 분석해도 결과가 같고, 결과 리스트는 서로 독립적이어야 합니다."""
+        result = observe_v2("팀 3명, 6개월, 인터넷 불가 환경이고 보안 정책 적용, 요구사항은 유동적")
+        first = reason(result)
+        second = reason(result)
+
+        assert first == second
+        assert any("[운영제약]" in c for c in first.constraints)
+
+        first.constraints.append("[테스트] 변경")
+        assert "[테스트] 변경" not in reason(result).constraints
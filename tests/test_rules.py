@@ -245,6 +245,17 @@ class TestVolatilityRule:
 
         assert rule.applies(ctx) is True, "변동성 키워드가 있을 때 applies()는 True여야 합니다"
 
+    def test_keywords_matched_case_insensitively(self) -> None:
+        """대문자 키워드도 컨텍스트의 소문자 텍스트로 탐지되어야 합니다."""
+        result = ObservationResult(
+            raw_input="Scope is EVOLVING",
+            scope_volatility_score=0,
+        )
+        ctx = RuleContext(result=result)
+
+        assert ctx.text_lower == "scope is evolving"
+        assert VolatilityRule().applies(ctx) is True
+
     def test_not_applies_when_low_volatility(self) -> None:
         """변동성이 낮고 키워드가 없을 때 규칙이 적용되지 않아야 합니다."""
         result = ObservationResult(